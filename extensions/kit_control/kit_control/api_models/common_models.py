@@ -9,7 +9,7 @@
 # its affiliates is strictly prohibited.from pydantic import BaseModel
 
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class MessageResponse(BaseModel):
@@ -21,4 +21,6 @@ class MessageResponse(BaseModel):
         message (str): The response message to be returned.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     message: str
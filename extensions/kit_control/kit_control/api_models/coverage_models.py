@@ -11,7 +11,7 @@
 
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CoverageRequest(BaseModel):
@@ -26,6 +26,8 @@ class CoverageRequest(BaseModel):
             report. Defaults to None.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     action: bool
     html_report_path: Optional[str] = None
 
@@ -43,6 +45,8 @@ class CoverageResponse(BaseModel):
             coverage. Defaults to None.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     message: str
     html_report_path: Optional[str] = None
     coverage_percentage: Optional[float] = None
@@ -11,7 +11,7 @@
 
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class SendKeysRequest(BaseModel):
@@ -26,6 +26,8 @@ class SendKeysRequest(BaseModel):
             between key presses to simulate human-like typing. Defaults to 20.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     element_id: str
     text: str
     human_delay_speed: Optional[int] = 20
@@ -46,6 +48,8 @@ class KeyPressRequest(BaseModel):
             keys. Defaults to 5.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     combo: str
     hold: bool
     release: bool
@@ -11,7 +11,7 @@
 
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class JoinSessionRequest(BaseModel):
@@ -24,6 +24,8 @@ class JoinSessionRequest(BaseModel):
         session_name (str): The name of the session to join.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     usd_path: str
     session_name: str
 
@@ -39,5 +41,7 @@ class CreateSessionRequest(BaseModel):
             None.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     session_name: str
     layer_name: Optional[str] = None
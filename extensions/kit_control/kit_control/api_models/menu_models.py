@@ -11,7 +11,7 @@
 
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ContextMenuRequest(BaseModel):
@@ -30,6 +30,8 @@ class ContextMenuRequest(BaseModel):
             between key presses to simulate human-like typing. Defaults to 10.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     path: str
     offset_x: Optional[int] = 50
     offset_y: Optional[int] = 0
@@ -45,4 +47,6 @@ class MenuClickRequest(BaseModel):
         path (str): The path of the menu item to click, separated by '/'.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     path: str
@@ -9,7 +9,12 @@
 # its affiliates is strictly prohibited.
 
 
-from pydantic import BaseModel
+from pathlib import PurePath
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+# File extensions accepted for screenshots
+SCREENSHOT_SUFFIXES = (".png", ".jpeg", ".jpg")
 
 
 class ScreenshotResponse(BaseModel):
@@ -22,6 +27,8 @@ class ScreenshotResponse(BaseModel):
         message (str): The response message.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     file_path: str = ""
     message: str
 
@@ -33,10 +40,23 @@ class ScreenshotRequest(BaseModel):
     Attributes:
     
         dir (str): The directory where the screenshot image will be saved.
+
+    Validators:
+    
+        screenshot_format_must_be_supported: Ensures that dir ends with a .png, .jpeg or .jpg file extension.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     dir: str
 
+    @field_validator("dir")
+    @classmethod
+    def screenshot_format_must_be_supported(cls, v):
+        if PurePath(v).suffix.lower() not in SCREENSHOT_SUFFIXES:
+            raise ValueError("Please specify the format png or jpeg")
+        return v
+
 
 class StageLoadRequest(BaseModel):
     """
@@ -48,5 +68,7 @@ class StageLoadRequest(BaseModel):
         seconds (int): Max number of seconds to load.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     frames: int
     seconds: int
@@ -11,7 +11,7 @@
 
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ScrollRequestModel(BaseModel):
@@ -25,25 +25,25 @@ class ScrollRequestModel(BaseModel):
         scroll_amount (float): The amount to scroll by.
         0 brings the widget to top, 0.5 to middle and 1 to bottom of the window.
 
-    Config:
+    model_config:
     
-        schema_extra (Dict): Additional schema metadata for the request model.
+        json_schema_extra (Dict): Additional schema metadata for the request model.
     """
 
-    element_id: str
-    axis: str
-    scroll_amount: float
-
-    class Config:
-        """Configuration for the request model"""
-
-        schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "element_id": "b252968a-d0e6-46c6-a75e-13467f50ee37",
                 "axis": "X",
                 "scroll_amount": 0.5,
             }
-        }
+        },
+    )
+
+    element_id: str
+    axis: str
+    scroll_amount: float
 
 
 class ClickRequest(BaseModel):
@@ -57,6 +57,8 @@ class ClickRequest(BaseModel):
             front before clicking. Defaults to True.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     element_id: str
     bring_to_front: Optional[bool] = True
 
@@ -71,25 +73,25 @@ class DragDropRequestModel(BaseModel):
         xpos (float): The x-coordinate of the position to drop the element.
         ypos (float): The y-coordinate of the position to drop the element.
 
-    Config:
+    model_config:
     
         json_schema_extra (Dict): Additional schema metadata for the request model.
     """
 
-    element_id: str
-    xpos: float
-    ypos: float
-
-    class Config:
-        """Configuration for the request model"""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "element_id": "12345",
                 "xpos": 100,
                 "ypos": 200,
             }
-        }
+        },
+    )
+
+    element_id: str
+    xpos: float
+    ypos: float
 
 
 class DragFromDropToRequestModel(BaseModel):
@@ -104,27 +106,27 @@ class DragFromDropToRequestModel(BaseModel):
         x_dest (float): The x-coordinate of the ending position of the drag.
         y_dest (float): The y-coordinate of the ending position of the drag.
 
-    Config:
+    model_config:
     
         json_schema_extra (Dict): Additional schema metadata for the request model.
     """
 
-    x_in: float
-    y_in: float
-    x_dest: float
-    y_dest: float
-
-    class Config:
-        """Configuration for the request model"""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "x_in": 100,
                 "y_in": 100,
                 "x_dest": 200,
                 "y_dest": 200,
             }
-        }
+        },
+    )
+
+    x_in: float
+    y_in: float
+    x_dest: float
+    y_dest: float
 
 
 class MouseMove(BaseModel):
@@ -137,6 +139,8 @@ class MouseMove(BaseModel):
         y (float): The y-coordinate of the new mouse position.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     x: float
     y: float
 
@@ -155,6 +159,8 @@ class ClickAt(BaseModel):
             False.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     x: float
     y: float
     right: bool = False
@@ -181,6 +187,8 @@ class ClickHold(BaseModel):
         that the mouse button was actually held and released.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     x: float
     y: float
     right: bool
@@ -11,7 +11,7 @@
 
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class FindElementResponse(BaseModel):
@@ -25,6 +25,8 @@ class FindElementResponse(BaseModel):
         properties (Optional[Dict]): A dictionary of properties of the found element, or None if no element was found.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     element_id: Optional[str]
 
     message: str
@@ -42,6 +44,8 @@ class FindElementRequest(BaseModel):
         root_widget_id (Optional[str]): The ID of the root widget, if searching within a specific widget tree. Defaults to None.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     locator: str
 
     root_widget_id: Optional[str] = None
@@ -58,6 +62,8 @@ class FindElementsRequest(BaseModel):
         get_properties (bool): Whether to return a dictionary of properties for each found element. Defaults to True.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     locator: str
 
     root_widget_id: Optional[str] = None
@@ -75,6 +81,8 @@ class FindElementsResponse(BaseModel):
         count (int): The number of elements found.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     elements: List[FindElementResponse]
 
     count: int
@@ -11,7 +11,7 @@
 
 from typing import Dict, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class PrimTransformPropertiesResponse(BaseModel):
@@ -26,6 +26,8 @@ class PrimTransformPropertiesResponse(BaseModel):
         scale (Dict[str, float]): The scale properties of the prim.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     prim_path: str
     translate: Dict[str, float]
     rotate: Dict[str, float]
@@ -11,7 +11,7 @@
 
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ViewportScreenshotRequest(BaseModel):
@@ -23,6 +23,8 @@ class ViewportScreenshotRequest(BaseModel):
         dir (str): The directory where the screenshot will be saved.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     dir: str
 
 
@@ -36,6 +38,8 @@ class ViewportScreenshotResponse(BaseModel):
         message (str): A message describing the result of the request.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     file_path: str = ""
     message: str
 
@@ -50,26 +54,26 @@ class ZoomViewportRequest(BaseModel):
         x (float): The x-coordinate of the point to zoom in/out around.
         y (float): The y-coordinate of the point to zoom in/out around.
 
-    Config:
+    model_config:
 
-        schema_extra (Dict): Additional schema metadata for the request model.
+        json_schema_extra (Dict): Additional schema metadata for the request model.
 
     """
 
-    direction: str
-    x: float
-    y: float
-
-    class Config:
-        """Configuration for the request model"""
-
-        schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "direction": "IN",
                 "x": 100,
                 "y": 500,
             }
-        }
+        },
+    )
+
+    direction: str
+    x: float
+    y: float
 
 
 class CoordinateViewportRequest(BaseModel):
@@ -81,24 +85,24 @@ class CoordinateViewportRequest(BaseModel):
         x (float): The x-coordinate to move the viewport to.
         y (float): The y-coordinate to move the viewport to.
 
-    Config:
+    model_config:
 
-        schema_extra (Dict): Additional schema metadata for the request model.
+        json_schema_extra (Dict): Additional schema metadata for the request model.
 
     """
 
-    x: float
-    y: float
-
-    class Config:
-        """Configuration for the request model"""
-
-        schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "x": 100,
                 "y": 500,
             }
-        }
+        },
+    )
+
+    x: float
+    y: float
 
 
 class CameraSettingsResponse(BaseModel):
@@ -113,6 +117,8 @@ class CameraSettingsResponse(BaseModel):
         lens (dict, optional): The camera lens settings.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     camera_path: str
     speed: Optional[dict] = None
     exposure: Optional[dict] = None
@@ -11,7 +11,7 @@
 
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict, validator
 
 
 class ComboBoxInfo(BaseModel):
@@ -26,6 +26,8 @@ class ComboBoxInfo(BaseModel):
         options_count (int): The total number of options available in the combo box.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     current_value: str
     current_index: int
     all_options: List[str]
@@ -46,6 +48,8 @@ class ComboBoxRequest(BaseModel):
         one_of_index_or_name_must_be_provided: Ensures that either index or name is provided.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     identifier: str
     index: Optional[int] = None
     name: Optional[str] = None
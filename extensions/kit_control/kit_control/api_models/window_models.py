@@ -11,7 +11,7 @@
 
 from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class WindowListResponse(BaseModel):
@@ -25,6 +25,8 @@ class WindowListResponse(BaseModel):
         all_windows (List[str]): A list of paths to all application windows.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     visible_windows: List[str]
     all_windows: List[str]
 
@@ -41,6 +43,8 @@ class DockWindowRequest(BaseModel):
             second window. Can be 'LEFT', 'RIGHT', 'TOP', or 'BOTTOM'.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     first_window: str
     second_window: str
     dock_position: str
@@ -57,6 +61,8 @@ class ResizeWindowRequest(BaseModel):
         new_height (float): The new height of the window.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     new_width: float
     new_height: float
@@ -9,8 +9,10 @@
 # its affiliates is strictly prohibited.
 
 
+import asyncio
 import logging
 import os
+from typing import Optional
 
 import carb
 import coverage
@@ -23,12 +25,84 @@ router = routers.ServiceAPIRouter()
 settings = carb.settings.get_settings()
 logger = logging.getLogger("kit_control")
 
-code_directory = []
-code_directory.extend(settings.get("/app/exts/foldersCore"))
-code_directory.extend(settings.get("/app/exts/folders"))
-cov = coverage.Coverage(source=code_directory, branch=True)
+# Extension folders measured by coverage, read once from the app settings
+code_directory = tuple(settings.get("/app/exts/foldersCore") or ()) + tuple(
+    settings.get("/app/exts/folders") or ()
+)
+code_directory_text = ", ".join(code_directory)
+cov = coverage.Coverage(source=list(code_directory), branch=True)
 coverage_location = os.path.join(os.path.expanduser("~"), "Coverage")
 coverage_started = False
+# Serializes starting and stopping coverage, held until the report of a stop has been written
+coverage_lock = asyncio.Lock()
+
+# Responses to requests for the state coverage is already in, shared since the model is frozen
+COVERAGE_ALREADY_STARTED = CoverageResponse(message="Code coverage has already started")
+COVERAGE_NOT_STARTED = CoverageResponse(message="Code coverage has not started yet")
+
+
+def start_coverage() -> CoverageResponse:
+    """
+    Starts coverage unless it is already running.
+
+    Returns:
+        CoverageResponse: The response to the start request.
+    """
+    global coverage_started
+
+    if coverage_started:
+        return COVERAGE_ALREADY_STARTED
+    cov.start()
+    coverage_started = True
+    message = (
+        f"Code coverage started. Monitoring following paths - {code_directory_text}"
+    )
+    logger.info(message)
+    return CoverageResponse(message=message)
+
+
+async def stop_coverage(html_report_path: str) -> Optional[float]:
+    """
+    Stops coverage if it is running and writes the HTML report.
+
+    Coverage only counts as stopped once the report has been written, so coverage_lock must be held
+    and a start request cannot restart cov while the report is still reading it.
+
+    Parameters:
+        html_report_path (str): The folder to write the HTML report to.
+
+    Returns:
+        Optional[float]: The percentage of code covered, or None if coverage was not running.
+    """
+    global coverage_started
+
+    if not coverage_started:
+        return None
+    cov.stop()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, save_html_report, html_report_path
+        )
+    finally:
+        coverage_started = False
+
+
+def save_html_report(html_report_path: str) -> float:
+    """
+    Saves the collected coverage data and writes the HTML report.
+
+    This is blocking work and is run in a worker thread so the event loop keeps serving other requests.
+
+    Parameters:
+        html_report_path (str): The folder to write the HTML report to.
+
+    Returns:
+        float: The percentage of code covered.
+    """
+    cov.save()
+    coverage_percentage = cov.html_report(directory=html_report_path)
+    cov.save()
+    return coverage_percentage
 
 
 @router.post(
@@ -59,40 +133,23 @@ async def code_coverage(request: CoverageRequest):
 
         HTTPException: If the request is invalid or the code coverage could not be performed.
     """
-    global coverage_started
-
     if request.action:
-        if not coverage_started:
-            cov.start()
-            message = f"Code coverage started. Monitoring following paths - {', '.join(code_directory)}"
-            logger.info(message)
-            coverage_started = True
-            return CoverageResponse(message=message)
-        else:
-            message = "Code coverage has already started"
-            return CoverageResponse(message=message)
-    else:
-        if coverage_started:
-            cov.stop()
-            cov.save()
-
-            html_report_path = (
-                request.html_report_path
-                if request.html_report_path
-                else coverage_location
-            )
-            coverage_percentage = cov.html_report(directory=html_report_path)
-            cov.save()
-            coverage_started = False
-            message = "Code coverage stopped and saved"
-            logger.info(message)
-            logger.info(f"HTML Coverage Report Path - {html_report_path}")
-            logger.info(f"Coverage Percentage - {message}")
-            return CoverageResponse(
-                message=message,
-                html_report_path=html_report_path,
-                coverage_percentage=coverage_percentage,
-            )
-        else:
-            message = "Code coverage has not started yet"
-            return CoverageResponse(message=message)
+        async with coverage_lock:
+            return start_coverage()
+
+    if not coverage_started:
+        return COVERAGE_NOT_STARTED
+    html_report_path = request.html_report_path or coverage_location
+    async with coverage_lock:
+        coverage_percentage = await stop_coverage(html_report_path)
+    if coverage_percentage is None:
+        return COVERAGE_NOT_STARTED
+    message = "Code coverage stopped and saved"
+    logger.info(message)
+    logger.info("HTML Coverage Report Path - %s", html_report_path)
+    logger.info("Coverage Percentage - %s", coverage_percentage)
+    return CoverageResponse(
+        message=message,
+        html_report_path=html_report_path,
+        coverage_percentage=coverage_percentage,
+    )
@@ -9,59 +9,410 @@
 # its affiliates is strictly prohibited.
 
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Union
-import html
-from fastapi import HTTPException, status
-from fastapi.responses import JSONResponse
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union
+
+import omni.kit.app
+from fastapi import HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from omni.services.core import routers
 
+from ..utils.json_utils import DefaultJSONResponse, json_dumps
+
 logger = logging.getLogger("kit_control")
 
-router = routers.ServiceAPIRouter()
+router = routers.ServiceAPIRouter(default_response_class=DefaultJSONResponse)
+
+# Runs the blocking extension manager calls off the event loop. Created on first use and shut down
+# with the extension.
+# ExtensionManager does not document its methods as safe to call concurrently, so the executor has a
+# single worker and at most one of these calls runs at a time. The caches below are only read and
+# written on the event loop thread, the worker only runs the manager calls and the serialization.
+extension_executor = None
+
+# Extension IDs accepted by extension_details, 'ext_name-version' made of alphanumerics and ._+-
+EXTENSION_ID_PATTERN = re.compile(r"[A-Za-z0-9._+\-]{1,256}")
+
+# Seconds between registry syncs triggered by extension_list
+REGISTRY_SYNC_TTL = 30.0
+# Time of the last registry sync, None until the registry is first synced
+registry_synced_at = None
+# Registry sync in progress, shared by concurrent extension_list requests
+registry_sync_in_flight: Optional[asyncio.Future] = None
+
+# Seconds the extension details fetched by extension_details are reused, and the number of cached details
+EXTENSION_DICT_TTL = 60.0
+EXTENSION_DICT_CACHE_SIZE = 2048
+# Serialized extension details by extension ID, with the time they were fetched
+extension_dict_cache: Dict[str, Tuple[float, bytes]] = {}
+# Extension details lookups in progress by extension ID, shared by concurrent requests for the same ID
+extension_details_in_flight: Dict[str, asyncio.Future] = {}
+
+
+async def run_in_extension_executor(func, *args):
+    """
+    Runs a blocking extension manager call in the extension executor, creating it if needed.
+
+    Parameters:
+        func: The callable to run.
+        *args: The arguments passed to the callable.
+
+    Returns:
+        The result of the call.
+    """
+    global extension_executor
+
+    if extension_executor is None:
+        extension_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="kit_control_extension"
+        )
+    return await asyncio.get_running_loop().run_in_executor(
+        extension_executor, func, *args
+    )
+
+
+def shutdown_extension_executor():
+    """
+    Shuts down the extension executor without waiting for running calls.
+    """
+    global extension_executor
+
+    if extension_executor is not None:
+        extension_executor.shutdown(wait=False)
+        extension_executor = None
+
+
+async def sync_registry(ext_man):
+    """
+    Syncs the extension registry unless it was synced less than REGISTRY_SYNC_TTL seconds ago.
+
+    Requests arriving while a sync is running await the same sync instead of starting another one.
+
+    Parameters:
+        ext_man: The extension manager.
+    """
+    global registry_sync_in_flight
+
+    if (
+        registry_synced_at is not None
+        and time.monotonic() - registry_synced_at <= REGISTRY_SYNC_TTL
+    ):
+        return
+    if registry_sync_in_flight is None:
+        registry_sync_in_flight = asyncio.ensure_future(run_registry_sync(ext_man))
+    await asyncio.shield(registry_sync_in_flight)
+
+
+async def run_registry_sync(ext_man):
+    """
+    Syncs the extension registry in the extension executor and records the time of the sync.
+
+    Parameters:
+        ext_man: The extension manager.
+    """
+    global registry_synced_at, registry_sync_in_flight
+
+    try:
+        await run_in_extension_executor(ext_man.sync_registry)
+        registry_synced_at = time.monotonic()
+    finally:
+        registry_sync_in_flight = None
+
+
+def load_extension_details_json(ext_man, ext_id: str) -> Optional[bytes]:
+    """
+    Gets the dict of an installed or registry extension serialized as JSON.
+
+    This is blocking work and is run in the extension executor, it does not touch the module caches.
+    The installed extensions are looked up first and the registry only if the extension is not installed.
+
+    Parameters:
+        ext_man: The extension manager.
+        ext_id (str): The unique identifier of the extension.
+
+    Returns:
+        Optional[bytes]: The JSON extension details, or None if the extension is not found.
+    """
+    ext_dict = ext_man.get_extension_dict(ext_id)
+    if ext_dict is None:
+        ext_dict = ext_man.get_registry_extension_dict(ext_id)
+    if ext_dict is None:
+        return None
+    return json_dumps(ext_dict.get_dict())
+
+
+async def load_and_cache_extension_details_json(
+    ext_man, ext_id: str
+) -> Optional[bytes]:
+    """
+    Loads the serialized details of an extension in the extension executor and caches them.
+
+    The oldest entry is dropped when the cache is full. Extensions that are not found are not cached.
+
+    Parameters:
+        ext_man: The extension manager.
+        ext_id (str): The unique identifier of the extension.
+
+    Returns:
+        Optional[bytes]: The JSON extension details, or None if the extension is not found.
+    """
+    ext_json = await run_in_extension_executor(
+        load_extension_details_json, ext_man, ext_id
+    )
+    if ext_json is not None:
+        extension_dict_cache.pop(ext_id, None)
+        if len(extension_dict_cache) >= EXTENSION_DICT_CACHE_SIZE:
+            extension_dict_cache.pop(next(iter(extension_dict_cache)), None)
+        extension_dict_cache[ext_id] = (time.monotonic(), ext_json)
+    return ext_json
+
+
+async def fetch_extension_details_json(ext_man, ext_id: str) -> Optional[bytes]:
+    """
+    Gets the serialized details of an extension, sharing the lookup between concurrent requests.
+
+    Details are reused for EXTENSION_DICT_TTL seconds. On a miss, the first request for an extension ID
+    starts the lookup in the extension executor, requests for the same ID arriving before it completes
+    await the same lookup instead of starting their own. The lookup is shielded, so a cancelled request
+    does not cancel it for the others.
+
+    Parameters:
+        ext_man: The extension manager.
+        ext_id (str): The unique identifier of the extension.
+
+    Returns:
+        Optional[bytes]: The JSON extension details, or None if the extension is not found.
+    """
+    cached = extension_dict_cache.get(ext_id)
+    if cached is not None and time.monotonic() - cached[0] <= EXTENSION_DICT_TTL:
+        return cached[1]
+
+    future = extension_details_in_flight.get(ext_id)
+    if future is None:
+        future = asyncio.ensure_future(
+            load_and_cache_extension_details_json(ext_man, ext_id)
+        )
+        extension_details_in_flight[ext_id] = future
+        future.add_done_callback(
+            lambda _: extension_details_in_flight.pop(ext_id, None)
+        )
+    return await asyncio.shield(future)
+
+
+def stream_json_items(
+    items: Sequence[dict], chunk_size: int, keys: Optional[Sequence[str]] = None
+) -> Iterator[bytes]:
+    """
+    Serializes dicts as the comma separated body of a JSON array, chunk_size dicts at a time.
+
+    The dicts are projected to the given keys one chunk at a time while streaming, so only the
+    chunk being serialized is copied.
+
+    Parameters:
+        items (Sequence[dict]): The JSON serializable dicts.
+        chunk_size (int): The number of dicts serialized in each yielded chunk.
+        keys (Sequence[str], optional): The keys to keep in each dict. Defaults to all keys.
+
+    Yields:
+        bytes: The serialized dicts, without the enclosing brackets.
+    """
+    for start in range(0, len(items), chunk_size):
+        page = items[start : start + chunk_size]
+        if keys:
+            page = [{key: item[key] for key in keys if key in item} for item in page]
+        chunk = b",".join(map(json_dumps, page))
+        yield chunk if start == 0 else b"," + chunk
+
+
+def stream_extension_list(
+    extensions: Sequence[dict],
+    registry_extensions: Sequence[dict],
+    product_extension_count: int,
+    registry_extension_count: int,
+    chunk_size: int,
+    keys: Optional[Sequence[str]] = None,
+) -> Iterator[bytes]:
+    """
+    Serializes the extension_list response as a stream of JSON chunks.
+
+    Parameters:
+        extensions (Sequence[dict]): The page of product extensions.
+        registry_extensions (Sequence[dict]): The page of registry extensions.
+        product_extension_count (int): The total count of product extensions.
+        registry_extension_count (int): The total count of registry extensions.
+        chunk_size (int): The number of extensions serialized in each chunk.
+        keys (Sequence[str], optional): The extension keys to keep. Defaults to all keys.
+
+    Yields:
+        bytes: The chunks of the JSON response body.
+    """
+    yield b'{"extensions":['
+    yield from stream_json_items(extensions, chunk_size, keys)
+    yield b'],"registry_extensions":['
+    yield from stream_json_items(registry_extensions, chunk_size, keys)
+    yield b'],"product_extension_count":%d,"registry_extension_count":%d}' % (
+        product_extension_count,
+        registry_extension_count,
+    )
+
+
+def extension_list_etag(
+    ext_list: Sequence[dict], ext_list_registry: Sequence[dict], *page_parameters
+) -> str:
+    """
+    Computes a weak ETag of the extension_list response.
+
+    The tag covers the ID and enabled state of the product extensions, the IDs of the registry
+    extensions and the parameters selecting the page, which determine the response content.
+
+    Parameters:
+        ext_list (Sequence[dict]): The product extensions.
+        ext_list_registry (Sequence[dict]): The registry extensions.
+        *page_parameters: The query parameters selecting the returned page and fields.
+
+    Returns:
+        str: The weak ETag.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(
+        repr([(ext.get("id"), ext.get("enabled")) for ext in ext_list]).encode()
+    )
+    digest.update(repr([ext.get("id") for ext in ext_list_registry]).encode())
+    digest.update(repr(page_parameters).encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+# OpenAPI description of the streamed extension_list response, which is not validated by a response model
+EXTENSION_LIST_RESPONSES = {
+    200: {
+        "description": "The requested page of the installed and registry extensions with their total counts.",
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "extensions": {
+                            "type": "array",
+                            "items": {"type": "object"},
+                            "description": "Installed extensions from offset up to limit, with only the keys in fields.",
+                        },
+                        "registry_extensions": {
+                            "type": "array",
+                            "items": {"type": "object"},
+                            "description": "Registry extensions from offset up to limit, with only the keys in fields.",
+                        },
+                        "product_extension_count": {
+                            "type": "integer",
+                            "description": "The total count of installed extensions.",
+                        },
+                        "registry_extension_count": {
+                            "type": "integer",
+                            "description": "The total count of registry extensions.",
+                        },
+                    },
+                }
+            }
+        },
+    },
+    304: {"description": "The extensions match the ETag given in If-None-Match."},
+}
 
 
 @router.get(
-    "/extension_list/", response_model=Dict[str, Union[List, int]], tags=["Extension"]
+    "/extension_list/",
+    response_model=None,
+    responses=EXTENSION_LIST_RESPONSES,
+    tags=["Extension"],
 )
-async def extension_list() -> Dict[str, Union[List, int]]:
+async def extension_list(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=0),
+    offset: int = Query(0, ge=0),
+    fields: Optional[str] = None,
+    page_size: int = Query(100, ge=1),
+) -> Response:
     """
         This endpoint fetches and returns a dictionary containing the list of product extensions,
     the list of registry extensions, and the count of each.
 
+    The lists can be paginated with `offset` and `limit`, which apply to both lists, and projected
+    to the comma separated keys given in `fields`. The counts are always the total counts.
+    The response is streamed, serializing `page_size` extensions at a time.
+    The response has an ETag, a request whose `If-None-Match` header matches it gets an empty
+    304 Not Modified response instead.
+
     `WARNING`:
 
         This operation might time out if the list of available extensions is large.
-    In such scenarios, it is recommended to use the 'extension_details' API instead.
+    In such scenarios, it is recommended to paginate the list or to use the 'extension_details' API instead.
+
+    Parameters:
+
+        limit (int, optional): The maximum number of extensions returned from each list. Defaults to all of them.
+        offset (int, optional): The number of extensions skipped at the start of each list. Defaults to 0.
+        fields (str, optional): Comma separated extension keys to return, for example 'id,name,enabled'.
+            Defaults to all keys.
+        page_size (int, optional): The number of extensions serialized per streamed chunk. Defaults to 100.
 
     Returns:
 
-        Dict[str, Union[List, int]]: A dictionary containing the following keys:
-            - 'product_extensions': A list of installed product extensions.
-            - 'registry_extensions': A list of registry extensions.
-            - 'product_extensions_count': The count of installed product extensions.
-            - 'registry_extensions_count': The count of registry extensions.
+        StreamingResponse: A JSON object containing the following keys:
+            - 'extensions': The requested page of the installed product extensions.
+            - 'registry_extensions': The requested page of the registry extensions.
+            - 'product_extension_count': The total count of installed product extensions.
+            - 'registry_extension_count': The total count of registry extensions.
 
     Raises:
 
         HTTPException: If there's an error fetching the extensions.
     """
-
-    import omni.kit.app
-
     try:
         ext_man = omni.kit.app.get_app().get_extension_manager()
-        ext_list = ext_man.get_extensions()
-        ext_man.sync_registry()
-        ext_list_registry = ext_man.get_registry_extensions()
-        msg = f"Product Extensions: {len(ext_list)}, Registry Extensions: {len(ext_list_registry)}"
-        logger.info(msg)
-        return {
-            "extensions": ext_list,
-            "registry_extensions": ext_list_registry,
-            "product_extension_count": len(ext_list),
-            "registry_extension_count": len(ext_list_registry),
-        }
+        ext_list = await run_in_extension_executor(ext_man.get_extensions)
+        await sync_registry(ext_man)
+        ext_list_registry = await run_in_extension_executor(
+            ext_man.get_registry_extensions
+        )
+        product_count = len(ext_list)
+        registry_count = len(ext_list_registry)
+        logger.info(
+            "Product Extensions: %s, Registry Extensions: %s",
+            product_count,
+            registry_count,
+        )
+
+        etag = extension_list_etag(ext_list, ext_list_registry, limit, offset, fields)
+        headers = {"ETag": etag, "Cache-Control": "private, max-age=5"}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and (
+            if_none_match.strip() == "*"
+            or etag in (tag.strip() for tag in if_none_match.split(","))
+        ):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        end = None if limit is None else offset + limit
+        keys = (
+            [key.strip() for key in fields.split(",") if key.strip()]
+            if fields
+            else None
+        )
+        return StreamingResponse(
+            stream_extension_list(
+                ext_list[offset:end],
+                ext_list_registry[offset:end],
+                product_count,
+                registry_count,
+                page_size,
+                keys,
+            ),
+            media_type="application/json",
+            headers=headers,
+        )
     except Exception as e:
         msg = f"Failed to fetch extensions. Error: {str(e)}"
         logger.error(msg)
@@ -93,33 +444,33 @@ async def extension_details(ext_id: str):
 
     Raises:
 
-        HTTPException: If the extension is not found or an error occurs during the fetching process.
+        HTTPException: If the extension ID is invalid, the extension is not found or an error occurs
+            during the fetching process.
     """
-    import omni.kit.app
+    if EXTENSION_ID_PATTERN.fullmatch(ext_id) is None:
+        msg = "Invalid extension ID, expected the format 'ext_name-version'."
+        logger.error(msg)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=msg)
 
-    ext_id_cleaned = html.escape(ext_id)
     try:
         ext_man = omni.kit.app.get_app().get_extension_manager()
-        ext_details = (
-            ext_man.get_extension_dict(ext_id_cleaned)
-            if ext_man.get_extension_dict(ext_id_cleaned) is not None
-            else ext_man.get_registry_extension_dict(ext_id_cleaned)
-        )
+        ext_details = await fetch_extension_details_json(ext_man, ext_id)
         if ext_details is not None:
-            ext_details = ext_details.get_dict()
-            msg = f"Details of {ext_id_cleaned}: {type(dict(ext_details))}"
-            logger.info(msg)
-            return JSONResponse(
-                {"ext_id": ext_id_cleaned, "extension_details": ext_details}
+            logger.info("Fetched details of %s", ext_id)
+            # The cached details are already JSON, only the ID is serialized per request
+            return Response(
+                content=b'{"ext_id":%s,"extension_details":%s}'
+                % (json_dumps(ext_id), ext_details),
+                media_type="application/json",
             )
         else:
-            msg = f"Failed to fetch extension details for {ext_id_cleaned}."
+            msg = f"Failed to fetch extension details for {ext_id}."
             logger.error(msg)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg
             )
     except Exception as e:
-        msg = f"Failed to fetch extension details for {ext_id_cleaned}. Error: {str(e)}"
+        msg = f"Failed to fetch extension details for {ext_id}. Error: {str(e)}"
         logger.error(msg)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg
@@ -11,10 +11,10 @@
 
 import asyncio
 import logging
-from typing import Dict, List
+from typing import Dict, List, Sequence
 
 from carb.input import KeyboardEventType, KeyboardInput
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Response, status
 from omni.kit import ui_test
 from omni.services.core import routers
 from ..api_models.common_models import MessageResponse
@@ -23,12 +23,18 @@ from ..api_models.keyboard_models import (
     SendKeysRequest,
 )
 from ..utils.element_cache import element_cache
+from ..utils.json_utils import json_dumps
 from ..utils.omnielement import OmniElement
 
 logger = logging.getLogger("kit_control")
 
 router = routers.ServiceAPIRouter()
 
+# Keyboard inputs by name and the serialized key_bindings response body, the inputs do not change at runtime.
+# The body is immutable bytes, so a response cannot alter the one sent to later requests.
+KEYBOARD_INPUTS = dict(KeyboardInput.__members__)
+KEY_BINDINGS_JSON = json_dumps({"key_bindings": list(KEYBOARD_INPUTS)})
+
 
 @router.post(
     "/send_keys_to_element/",
@@ -58,7 +64,7 @@ async def send_keys_to_element(request: SendKeysRequest):
     try:
         element: OmniElement = element_cache.get_cached_element(request.element_id)
         await element.input(request.text, human_delay_speed=request.human_delay_speed)
-        result = True if element.text == request.text else False
+        result = element.text == request.text
     except KeyError:
         message = f"Element with Identifier {request.element_id} not found"
         logger.error(message)
@@ -158,25 +164,44 @@ async def send_key_combo(key_combo: str):
     return MessageResponse(message=message)
 
 
+async def emulate_keyboard_events(
+    event_type: KeyboardEventType, keys: Sequence[KeyboardInput]
+):
+    """
+    Sends the same keyboard event for several keyboard inputs as one batch.
+
+    The events are dispatched in the order of the keys and awaited together, so the keys share the
+    frames waited by each event instead of waiting for them one key after another.
+
+    Parameters:
+        event_type (KeyboardEventType): The keyboard event to send.
+        keys (Sequence[KeyboardInput]): The keyboard inputs to send the event for.
+    """
+    await asyncio.gather(
+        *(ui_test.input.emulate_keyboard(event_type, key) for key in keys)
+    )
+
+
 async def send_key_press(
-    key: KeyboardInput,
+    keys: Sequence[KeyboardInput],
     hold: bool = False,
     release: bool = False,
     hold_duration: int = 5,
 ):
     """
-        Simulates a key press event for the given keyboard input.
+        Simulates a key press event for the given keyboard inputs.
 
-    This function simulates a key press event for the given keyboard input. If hold is True, only the key press event will be sent.
-    If release is True, only the key release event will be sent.
-    Otherwise, both the key press and release events will be sent, with the key held down for hold_duration seconds.
+    This function simulates a key press event for the given keyboard inputs. If hold is True, only the key press events will be sent.
+    If release is True, only the key release events will be sent.
+    Otherwise, the key press events are sent, the keys are held down together for hold_duration seconds
+    and the key release events are sent in reverse order.
 
     Parameters:
 
-        key (KeyboardInput): The keyboard input to emulate.
-        hold (bool): If True, only the key press event will be sent. Defaults to False.
-        release (bool): If True, only the key release event will be sent. Defaults to False.
-        hold_duration (int): The duration to hold the key down, in seconds. Only used if hold is False. Defaults to 5.
+        keys (Sequence[KeyboardInput]): The keyboard inputs to emulate, in press order.
+        hold (bool): If True, only the key press events will be sent. Defaults to False.
+        release (bool): If True, only the key release events will be sent. Defaults to False.
+        hold_duration (int): The duration to hold the keys down, in seconds. Only used if hold is False. Defaults to 5.
 
     Raises:
 
@@ -186,13 +211,16 @@ async def send_key_press(
         raise ValueError("Both `hold` and `release` cannot be True.")
 
     if hold:
-        await ui_test.input.emulate_keyboard(KeyboardEventType.KEY_PRESS, key)
+        await emulate_keyboard_events(KeyboardEventType.KEY_PRESS, keys)
     elif release:
-        await ui_test.input.emulate_keyboard(KeyboardEventType.KEY_RELEASE, key)
+        await emulate_keyboard_events(KeyboardEventType.KEY_RELEASE, keys)
     else:
-        await ui_test.input.emulate_keyboard(KeyboardEventType.KEY_PRESS, key)
-        await asyncio.sleep(hold_duration)
-        await ui_test.input.emulate_keyboard(KeyboardEventType.KEY_PRESS, key)
+        # The keys are held from the first press, the frames waited by the presses count towards the hold
+        loop = asyncio.get_running_loop()
+        release_time = loop.time() + hold_duration
+        await emulate_keyboard_events(KeyboardEventType.KEY_PRESS, keys)
+        await asyncio.sleep(max(0.0, release_time - loop.time()))
+        await emulate_keyboard_events(KeyboardEventType.KEY_RELEASE, keys[::-1])
 
 
 @router.post(
@@ -226,16 +254,24 @@ async def key_events(request: KeyPressRequest):
         HTTPException: If the request is invalid or the key combo could not be pressed.
     """
     try:
-        keys = request.combo.split("+")
-        for key in keys:
-            input_button = KeyboardInput.__members__.get(key)
+        # Resolve the whole combo before sending any event, so an invalid key leaves no key pressed
+        input_buttons = []
+        for key in request.combo.split("+"):
+            input_button = KEYBOARD_INPUTS.get(key)
             if input_button is None:
                 raise ValueError(f"Invalid key: {key}")
-            await send_key_press(
-                input_button, request.hold, request.release, request.hold_duration
-            )
+            input_buttons.append(input_button)
+
+        await send_key_press(
+            input_buttons, request.hold, request.release, request.hold_duration
+        )
+        for input_button in input_buttons:
             logger.info(
-                f"Key Press Operation Performed - Key:{input_button}, Hold:{request.hold}, Release:{request.release}, Hold Duration:{request.hold_duration}"
+                "Key Press Operation Performed - Key:%s, Hold:%s, Release:%s, Hold Duration:%s",
+                input_button,
+                request.hold,
+                request.release,
+                request.hold_duration,
             )
         message = f"Key combo '{request.combo}' pressed."
         logger.info(message)
@@ -271,9 +307,13 @@ def key_bindings():
         HTTPException: If there is an error fetching the key bindings.
     """
     try:
-        key_bindings = list(KeyboardInput.__members__.keys())
         logger.info("Fetched the key bindings.")
-        return {"key_bindings": key_bindings}
+        # The bindings are static for the lifetime of the app, so clients may cache them
+        return Response(
+            content=KEY_BINDINGS_JSON,
+            media_type="application/json",
+            headers={"Cache-Control": "public, max-age=3600"},
+        )
     except Exception as e:
         message = f"Failed to fetch key bindings due to {str(e)}."
         logger.error(message)
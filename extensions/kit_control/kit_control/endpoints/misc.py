@@ -14,10 +14,15 @@ import logging
 import os
 from typing import Dict, List
 
+import omni.kit.app
+import omni.usd
 from fastapi import HTTPException
 from fastapi.responses import FileResponse
+from omni import ui
 from omni.kit import ui_test
+from omni.kit.ui_test import Vec2
 from omni.services.core import routers
+from omni.ui_query import OmniUIQuery
 from starlette.status import (
     HTTP_201_CREATED,
     HTTP_404_NOT_FOUND,
@@ -30,10 +35,73 @@ from ..api_models.misc_models import (
     ScreenshotResponse,
     StageLoadRequest,
 )
+from ..utils.json_utils import DefaultJSONResponse, json_dumps
 
 logger = logging.getLogger("kit_control")
 
-router = routers.ServiceAPIRouter()
+router = routers.ServiceAPIRouter(default_response_class=DefaultJSONResponse)
+
+# Text of the menu holding the application and render mode buttons
+APP_MODE_WIDGET_TEXT = "Application Mode Widget"
+
+# Seconds between loading status checks of wait_for_stage_load when no stage event arrives
+STAGE_LOAD_POLL_INTERVAL = 1.0
+
+# Mode buttons of the Application Mode Widget by name, resolved on first use of switch_app_mode
+app_mode_buttons = None
+
+
+def find_app_mode_buttons(refresh: bool = False):
+    """
+    Gets the application and render mode button groups of the Application Mode Widget.
+
+    The widget is searched in the UI once and its button groups are cached, later calls reuse them unless
+    refresh is True.
+
+    Parameters:
+        refresh (bool): Whether to search the UI again instead of using the cached buttons. Defaults to False.
+
+    Returns:
+        A tuple with the mode buttons by name of each control, or None if the application has no
+        Application Mode Widget.
+    """
+    global app_mode_buttons
+
+    if app_mode_buttons is not None and not refresh:
+        return app_mode_buttons
+
+    app_mode_buttons = None
+    menu_bar = OmniUIQuery.find_menu_item(APP_MODE_WIDGET_TEXT)  # Finds the menu bar
+    for widget in OmniUIQuery.find_widgets("*", [menu_bar]):
+        if isinstance(widget, (ui.Menu, ui.MenuItem)):
+            if widget.text == APP_MODE_WIDGET_TEXT:
+                controls = (
+                    widget.delegate.application_control,
+                    widget.delegate.render_control,
+                )
+                app_mode_buttons = tuple(
+                    control.button_group.children for control in controls if control
+                )
+                break
+    return app_mode_buttons
+
+
+def find_app_mode_button(button_groups, name: str):
+    """
+    Looks up a mode button by name in the button groups returned by find_app_mode_buttons.
+
+    Parameters:
+        button_groups: The mode button groups, or None.
+        name (str): The lower case name of the mode button.
+
+    Returns:
+        The first button with the given name, or None if there is none.
+    """
+    for buttons in button_groups or ():
+        button = buttons.get(name)
+        if button is not None:
+            return button
+    return None
 
 
 @router.get("/kit_control_status", tags=["KIT Control Status"])
@@ -111,36 +179,60 @@ async def wait_for_stage_load(request: StageLoadRequest):
 
         HTTPException: If the stage does not finish loading even after waiting for the specified number of frames.
     """
-    import time
-
-    import omni.usd
+    usd_context: omni.usd.UsdContext = omni.usd.get_context()
+    next_update_async = omni.kit.app.get_app().next_update_async
+    loop = asyncio.get_running_loop()
+    end = loop.time() + request.seconds
 
     flag = False
-    start = time.time()
-    end = start + request.seconds
-    usd_context: omni.usd.UsdContext = omni.usd.get_context()
-    frame_count = 0
-    while time.time() < end and frame_count < request.frames:
-        path, files_loaded, total_files = usd_context.get_stage_loading_status()
+    waited = False
+    stage_event = asyncio.Event()
+    subscription = None
+    try:
+        while request.frames > 0:
+            path, files_loaded, total_files = usd_context.get_stage_loading_status()
+            if not files_loaded and not total_files:
+                flag = True
+                break
+            remaining = end - loop.time()
+            if remaining <= 0:
+                break
+            if subscription is None:
+                logger.info(
+                    "Waiting for stage load. Path - %s, Files Loaded - %s, Total Files - %s",
+                    path,
+                    files_loaded,
+                    total_files,
+                )
+                # Stage events such as ASSETS_LOADED wake the wait up to check the loading status again
+                subscription = (
+                    usd_context.get_stage_event_stream().create_subscription_to_pop(
+                        lambda event: loop.call_soon_threadsafe(stage_event.set),
+                        name="kit_control wait_for_stage_load",
+                    )
+                )
+            stage_event.clear()
+            try:
+                await asyncio.wait_for(
+                    stage_event.wait(), min(remaining, STAGE_LOAD_POLL_INTERVAL)
+                )
+            except asyncio.TimeoutError:
+                pass
+            waited = True
+    finally:
+        if subscription is not None:
+            subscription.unsubscribe()
+
+    # Let the loaded stage settle for a couple of frames, not needed if it was already loaded
+    if waited:
         logger.info(
-            f"Path - {path}, Files Loaded - {files_loaded}, Total Files - {total_files}"
+            "Stopped waiting for stage load. Path - %s, Files Loaded - %s, Total Files - %s",
+            path,
+            files_loaded,
+            total_files,
         )
-        if files_loaded or total_files:
-            logger.info("Waiting for all assets to get loaded.")
-            await omni.kit.app.get_app().next_update_async()
-            continue
-        if not files_loaded or not total_files:
-            flag = True
-        if not flag and frame_count != request.frames:
-            logger.info(f"Waiting for {request.frames} frames.")
-            await omni.kit.app.get_app().next_update_async()
-            frame_count += 1
-            continue
-
-        break
-
-    await omni.kit.app.get_app().next_update_async()
-    await omni.kit.app.get_app().next_update_async()
+        await next_update_async()
+        await next_update_async()
 
     if flag:
         msg = f"Stage has been successfully loaded within {request.frames} frames and {request.seconds} seconds."
@@ -167,13 +259,13 @@ async def stage():
 
         HTTPException: If there is an error getting the stage from the USD context.
     """
-    from omni import usd
-
     try:
-        stage = usd.get_context().get_stage()
+        usd_context = omni.usd.get_context()
+        stage = usd_context.get_stage()
         prims = [str(x) for x in stage.Traverse()]
-        selection = usd.get_context().get_selection().get_selected_prim_paths()
-        return {"all_prims": prims, "selected_prims": selection}
+        selection = usd_context.get_selection().get_selected_prim_paths()
+        # Returned as a response so the prim list skips response model validation and encoding
+        return DefaultJSONResponse({"all_prims": prims, "selected_prims": selection})
     except Exception as e:
         msg = f"Unable to get stage from USD Context {str(e)}"
         logger.error(msg)
@@ -206,43 +298,45 @@ async def switch_app_mode(option_name: str):
 
         HTTPException: If the option name is not found or an error occurs during the process.
     """
-    from omni import ui
-    from omni.kit.ui_test import Vec2
-    from omni.ui_query import OmniUIQuery
+    global app_mode_buttons
 
     try:
-        menu_bar = OmniUIQuery.find_menu_item(
-            "Application Mode Widget"
-        )  # Finds the menu bar
-
-        for widget in OmniUIQuery.find_widgets("*", [menu_bar]):
-            if isinstance(widget, ui.Menu) or isinstance(widget, ui.MenuItem):
-                if widget.text == "Application Mode Widget":
-                    all_buttons = {}
-                    amc = widget.delegate.application_control
-                    if amc:
-                        all_buttons.update(amc.button_group.children)
-                    rmc = widget.delegate.render_control
-                    if rmc:
-                        all_buttons.update(rmc.button_group.children)
-                    target_button = all_buttons[option_name.lower()]
-                    center = Vec2(target_button.screen_position) + Vec2(
-                        target_button._label.computed_width / 2,
-                        target_button._label.computed_height / 2,
-                    )
-                    await ui_test.emulate_mouse_move_and_click(center)
-                    if not target_button.selected:
-                        message = f"Failed to select '{option_name}' label"
-                        logger.error(message)
-                        raise HTTPException(
-                            status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail=message
-                        )
-
-                    msg = f"Switched to '{option_name}' option."
-                    logger.info(msg)
-                    return MessageResponse(message=msg)
-        msg = f"App modes are not available in this application."
-        logger.error(msg)
+        name = option_name.lower()
+        button_groups = find_app_mode_buttons()
+        target_button = find_app_mode_button(button_groups, name)
+        # The cached buttons are searched again if the option is missing, the UI may have been rebuilt
+        if target_button is None and button_groups is not None:
+            button_groups = find_app_mode_buttons(refresh=True)
+            target_button = find_app_mode_button(button_groups, name)
+        if button_groups is None:
+            msg = f"App modes are not available in this application."
+            logger.error(msg)
+            return MessageResponse(message=msg)
+        if target_button is None:
+            raise KeyError(option_name)
+
+        try:
+            center = Vec2(target_button.screen_position) + Vec2(
+                target_button._label.computed_width / 2,
+                target_button._label.computed_height / 2,
+            )
+            await ui_test.emulate_mouse_move_and_click(center)
+        except Exception:
+            # The button may belong to a destroyed widget, search the UI again on the next request
+            app_mode_buttons = None
+            raise
+        if not target_button.selected:
+            # A button of a rebuilt UI is clicked at a stale position without raising, so the cached
+            # buttons are searched again on the next request here too
+            app_mode_buttons = None
+            message = f"Failed to select '{option_name}' label"
+            logger.error(message)
+            raise HTTPException(
+                status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail=message
+            )
+
+        msg = f"Switched to '{option_name}' option."
+        logger.info(msg)
         return MessageResponse(message=msg)
     except KeyError:
         msg = f"Option with name {option_name} not found"
@@ -266,7 +360,8 @@ async def capture_full_screenshot(request: ScreenshotRequest):
 
     This function captures a screenshot of the application and saves it to a specified directory.
 
-    Valid formats - `png` and `jpeg`
+    Valid formats - `png` and `jpeg`, given by the `.png`, `.jpeg` or `.jpg` file extension.
+    Other extensions are rejected with a 422 validation error.
 
     Path examples - `C:/users/user/screenshot.png`
 
@@ -287,23 +382,16 @@ async def capture_full_screenshot(request: ScreenshotRequest):
 
     import omni.renderer_capture
 
-    if "jpeg" in request.dir or "png" in request.dir:
-        try:
-
-            renderer_capture = (
-                omni.renderer_capture.acquire_renderer_capture_interface()
-            )
-            renderer_capture.capture_next_frame_swapchain(request.dir)
-            msg = f"Viewport screenshot captured successfully at {request.dir}."
-            logger.info(msg)
-            return ScreenshotResponse(file_path=request.dir, message=msg)
+    try:
+        renderer_capture = omni.renderer_capture.acquire_renderer_capture_interface()
+        renderer_capture.capture_next_frame_swapchain(request.dir)
+        msg = f"Viewport screenshot captured successfully at {request.dir}."
+        logger.info(msg)
+        return ScreenshotResponse(file_path=request.dir, message=msg)
 
-        except Exception as e:
-            msg = f"Error capturing screenshot: {str(e)}"
-            logger.error(msg)
-            raise HTTPException(status_code=500, detail=msg)
-    else:
-        msg = f"Error capturing viewport screenshot: Please specify the format png or jpeg"
+    except Exception as e:
+        msg = f"Error capturing screenshot: {str(e)}"
+        logger.error(msg)
         raise HTTPException(status_code=500, detail=msg)
 
 
@@ -328,26 +416,32 @@ async def fetch_all_materials():
 
         HTTPException: Unable to fetch data of all materials from materials window.
     """
-    import json
-
     from omni.kit.window.material import get_instance
 
     try:
         material_dict = {}
 
         def list_category(model, category):
-            if len(category.children) == 0:
-                lis = []
-                for detail in model.get_item_children(category):
-                    lis.append(detail.name)
-                return lis
-            dic = {}
-            dic["self"] = []
-            for detail in model.get_item_children(category):
-                dic["self"].append(detail.name)
-            for child in category.children:
-                dic[child.name] = list_category(model, child)
-            return dic
+            # Categories are walked with a stack of (parent dict, key, category), each category
+            # being stored under its key in the dict of its parent category
+            get_item_children = model.get_item_children
+            result = {}
+            stack = [(result, None, category)]
+            while stack:
+                parent, key, current = stack.pop()
+                names = [detail.name for detail in get_item_children(current)]
+                children = current.children
+                if not children:
+                    parent[key] = names
+                    continue
+                dic = {"self": names}
+                for child in children:
+                    # Reserve the key so the children keep their order in the dict
+                    dic[child.name] = None
+                parent[key] = dic
+                # Pushed in reverse so the children are listed in order
+                stack.extend((dic, child.name, child) for child in reversed(children))
+            return result[None]
 
         w = get_instance()._window
         if w:
@@ -361,7 +455,7 @@ async def fetch_all_materials():
                             material_dict[category.name] = list_category(
                                 model, category
                             )
-        json_data = json.dumps(material_dict)
+        json_data = json_dumps(material_dict).decode()
 
         return {"materials": json_data}
     except Exception as e:
@@ -10,16 +10,17 @@
 
 
 import logging
+from operator import attrgetter
 from typing import Dict, List
 
 import omni.client as omniclient
 from fastapi import HTTPException, status
-from fastapi.responses import JSONResponse
 from omni.services.core import routers
 
 from ..api_models.common_models import MessageResponse
+from ..utils.json_utils import DefaultJSONResponse
 
-router = routers.ServiceAPIRouter()
+router = routers.ServiceAPIRouter(default_response_class=DefaultJSONResponse)
 
 
 logger = logging.getLogger("kit_control")
@@ -41,12 +42,11 @@ async def list(folder_path: str):
     folder_contents = []
 
     try:
-        omniclient_resp = omniclient.list(folder_path)
+        omniclient_resp = await omniclient.list_async(folder_path)
         message = str(omniclient_resp[0])
         if message == "Result.OK":
-            folder_contents = [
-                current_data.relative_path for current_data in omniclient_resp[1]
-            ]
+            # The endpoint shadows the list builtin, unpack into a list literal instead
+            folder_contents = [*map(attrgetter("relative_path"), omniclient_resp[1])]
             logger.info(f"Fetched list of files from path: {folder_path}")
             return {"message": message, "folder_contents": folder_contents}
         else:
@@ -89,9 +89,7 @@ async def delete_folder_or_file(path: str):
     
         HTTPException: If the folder or file is not found.
     """
-    import omni.client
-
-    result = omni.client.delete(path)
+    result = await omniclient.delete_async(path)
     logger.info(f"Delete operation result: {result}")
     if result.name == "ERROR_NOT_FOUND":
         msg = f"File or folder not found at path {path}"
@@ -100,7 +98,7 @@ async def delete_folder_or_file(path: str):
     else:
         msg = f"File or folder deleted from path {path}"
         logger.info(msg)
-        return JSONResponse({"message": msg, "path": path})
+        return DefaultJSONResponse({"message": msg, "path": path})
 
 
 @router.post(
@@ -129,10 +127,8 @@ async def create_folder(path: str):
         HTTPException: If the folder creation fails.
 
     """
-    import omni.client
-
     try:
-        result = await omni.client.create_folder_async(path)
+        result = await omniclient.create_folder_async(path)
         logger.info(f"Create folder operation result: {result}")
         if result.name == "ERROR_ALREADY_EXISTS":
             msg = f"Folder already exists."
@@ -140,7 +136,7 @@ async def create_folder(path: str):
         else:
             msg = f"Folder created at path: {path}"
             logger.info(msg)
-        return JSONResponse({"message": msg, "path": path})
+        return DefaultJSONResponse({"message": msg, "path": path})
     except Exception as e:
         msg = f"Folder creation failed due to {str(e)}"
         logger.error(e)
@@ -155,9 +151,11 @@ async def create_folder(path: str):
     status_code=status.HTTP_201_CREATED,
     tags=["Nucleus"],
 )
-async def remove_server_connections(url: str):
+def remove_server_connections(url: str):
     """Removes nucleus server connection
 
+    This endpoint has no awaitable work, it is a plain function so it runs in the server threadpool.
+
     Parameters:
     
         url (str): Nuclues server url
@@ -175,7 +173,7 @@ async def remove_server_connections(url: str):
         omniclient.sign_out(url=url)
         logger.info(f"Removed connection for url: {url}")
         message = f"Removed connection for url: {url}"
-        return JSONResponse({"message": message})
+        return DefaultJSONResponse({"message": message})
 
     except Exception as e:
         msg = f"Failed to remove connection from {url} due to {str(e)}"
@@ -165,9 +165,10 @@ async def find_elements(request: FindElementsRequest):
 
         logger.info(message)
 
+        # Built from trusted values, so validation is skipped for each found element
         (
             response_list.append(
-                FindElementResponse(
+                FindElementResponse.model_construct(
                     element_id=identifier,
                     message=message,
                     properties=element_cache.get_cached_element(
@@ -177,9 +178,10 @@ async def find_elements(request: FindElementsRequest):
             )
             if request.get_properties
             else response_list.append(
-                FindElementResponse(
+                FindElementResponse.model_construct(
                     element_id=identifier,
                     message=message,
+                    properties=None,
                 )
             )
         )
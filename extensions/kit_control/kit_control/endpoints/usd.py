@@ -158,8 +158,7 @@ async def get_prims_visibility() -> Dict[str, List[str]]:
     """
     try:
         stage = UsdHelper.get_stage()
-        visible = UsdHelper.get_visible_prims(stage)
-        invisible = UsdHelper.get_invisible_prims(stage)
+        visible, invisible = UsdHelper.partition_prims_by_visibility(stage)
         logger.info("Fetched list of visible and invisible prims.")
         return {"visible_prims": visible, "invisible_prims": invisible}
     except RuntimeError as exc:
@@ -10,10 +10,8 @@
 
 
 import logging
-import time
-from typing import Dict, List
+from typing import Callable, Dict, Tuple
 
-import omni.ui as ui
 from fastapi import HTTPException, status
 from omni.services.core import routers
 
@@ -23,11 +21,69 @@ from ..api_models.widget_models import (
     ComboBoxRequest,
 )
 from ..utils.element_cache import element_cache
+from ..utils.json_utils import DefaultJSONResponse
 from ..utils.omnielement import OmniElement
 
 logger = logging.getLogger("kit_control")
 
-router = routers.ServiceAPIRouter()
+router = routers.ServiceAPIRouter(default_response_class=DefaultJSONResponse)
+
+
+# Call variants for combobox model operations whose signature differs between model implementations
+ITEM_CHILDREN_CALLS = (
+    lambda model: model.get_item_children(),
+    lambda model: model.get_item_children(item=None),
+)
+CURRENT_INDEX_READ_CALLS = (
+    lambda model: model.get_item_value_model(None, None),
+    lambda model: model.get_item_value_model(),
+)
+# The write is part of each variant, so a variant whose value model cannot be written falls back to the next
+CURRENT_INDEX_WRITE_CALLS = (
+    lambda model, index: setattr(model._current_index, "as_int", index),
+    lambda model, index: setattr(model.get_item_value_model(), "as_int", index),
+    lambda model, index: setattr(
+        model.get_item_value_model(item=None, column_id=None), "as_int", index
+    ),
+)
+
+# Call variant that worked for a model type, keyed by (model type, call variants)
+model_call_cache: Dict[Tuple[type, Tuple[Callable, ...]], Callable] = {}
+
+
+def call_combobox_model(combobox_model, calls: Tuple[Callable, ...], *args):
+    """
+    Calls a combobox model operation using the first signature supported by the model.
+
+    The supported variant is detected once per model type and cached, so subsequent calls on models
+    of the same type invoke it directly without probing.
+
+    Parameters:
+        combobox_model: The combobox model.
+        calls (Tuple[Callable, ...]): The call variants to try, in order of preference.
+        *args: The arguments passed to the call variant after the model.
+
+    Returns:
+        The result of the supported call variant.
+
+    Raises:
+        Exception: The error raised by the last variant if none of them is supported.
+    """
+    key = (type(combobox_model), calls)
+    call = model_call_cache.get(key)
+    if call is not None:
+        return call(combobox_model, *args)
+
+    for call in calls[:-1]:
+        try:
+            result = call(combobox_model, *args)
+        except Exception:
+            continue
+        model_call_cache[key] = call
+        return result
+    result = calls[-1](combobox_model, *args)
+    model_call_cache[key] = calls[-1]
+    return result
 
 
 @router.delete("/widgets/cache/", tags=["Widget"])
@@ -45,7 +101,7 @@ async def reset_widget_cache() -> dict[str, str]:
     """
     element_cache.reset_map()
 
-    if element_cache.get_map():  # Check if the cache is still populated
+    if not element_cache.is_empty():  # Check if the cache is still populated
         logger.error("Server cache reset operation failed.")
         raise HTTPException(
             status_code=500,
@@ -80,8 +136,6 @@ async def combobox_info(identifier: str):
     Raises:
         HTTPException: If the element with the provided identifier is not found, or if the item is not of type combobox.
     """
-    combobox_model = None
-
     try:
         element: OmniElement = element_cache.get_cached_element(identifier)
     except KeyError:
@@ -89,39 +143,30 @@ async def combobox_info(identifier: str):
         logger.error(msg)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
 
-    try:
-        combobox_model = element.model
-    except Exception:
-        try:
-            combobox_model = element.widget.delegate._model
-        except Exception as e:
-            msg = f"Combobox model not found. Error: {str(e)}"
-            logger.error(msg)
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
+    combobox_model = element.combobox_model
 
-    try:
-        string_items = combobox_model.get_item_children()
-    except Exception:
-        string_items = combobox_model.get_item_children(item=None)
+    if not combobox_model:
+        msg = f"Combobox model not found for element with ID {identifier}."
+        logger.error(msg)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
 
-    try:
-        index = combobox_model.get_item_value_model(None, None).as_int
-    except Exception:
-        index = combobox_model.get_item_value_model().as_int
-
-    value = combobox_model.get_item_value_model(string_items[index], 0).as_string
-    items = []
-    for i in string_items:
-        items.append(combobox_model.get_item_value_model(i, 0).as_string)
+    string_items = call_combobox_model(combobox_model, ITEM_CHILDREN_CALLS)
+    index = call_combobox_model(combobox_model, CURRENT_INDEX_READ_CALLS).as_int
+
+    get_value_model = combobox_model.get_item_value_model
+    value = get_value_model(string_items[index], 0).as_string
+    items = [get_value_model(i, 0).as_string for i in string_items]
     msg = (
         f"Found items in combobox {items}, current index {index}, current value {value}"
     )
     logger.info(msg)
-    return ComboBoxInfo(
-        current_index=index,
-        current_value=value,
-        all_options=items,
-        options_count=len(items),
+    return DefaultJSONResponse(
+        {
+            "current_value": value,
+            "current_index": index,
+            "all_options": items,
+            "options_count": len(items),
+        }
     )
 
 
@@ -148,17 +193,17 @@ async def bring_to_front(id: str, undock: bool) -> MessageResponse:
 
         HTTPException: If the element with the given ID is not found in the element cache.
     """
-    try:
-        element: OmniElement = element_cache.get_cached_element(id)
-        await element.bring_to_front(undock)
-        msg = f"Element with ID {id} brought to front with undock:{undock}"
-        logger.info(msg)
-        return MessageResponse(message=msg)
-    except KeyError:
+    element: OmniElement = element_cache.get(id)
+    if element is None:
         msg = f"Element with ID {id} not found in element cache."
         logger.error(msg)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
 
+    await element.bring_to_front(undock)
+    msg = f"Element with ID {id} brought to front with undock:{undock}"
+    logger.info(msg)
+    return MessageResponse(message=msg)
+
 
 @router.post(
     "/select_combobox_item/",
@@ -166,7 +211,7 @@ async def bring_to_front(id: str, undock: bool) -> MessageResponse:
     status_code=status.HTTP_201_CREATED,
     tags=["Widget"],
 )
-def select_combobox_item(request: ComboBoxRequest):
+async def select_combobox_item(request: ComboBoxRequest):
     """
         Selects an item from a combobox based on the provided index or name.
 
@@ -206,33 +251,27 @@ def select_combobox_item(request: ComboBoxRequest):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
 
     # Get the combobox model
-    combobox_model = getattr(omni_element, "model", None) or getattr(
-        omni_element.widget.delegate, "_model", None
-    )
+    combobox_model = omni_element.combobox_model
 
     if not combobox_model:
         message = f"Unable to fetch combobox model not found"
         logger.error(message)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
 
-    try:
-        # Get the string items in the combobox model
-        string_items = combobox_model.get_item_children()
-    except Exception:
-        # Get the string items in the combobox model if the above fails
-        string_items = combobox_model.get_item_children(item=None)
+    # Get the string items in the combobox model
+    string_items = call_combobox_model(combobox_model, ITEM_CHILDREN_CALLS)
 
     str_index = request.index
 
+    get_value_model = combobox_model.get_item_value_model
+
     if str_index is None:
+        # Stops reading item values at the first option with the requested name
         str_index = next(
             (
                 i
                 for i, value in enumerate(string_items)
-                if request.name
-                == combobox_model.get_item_value_model(
-                    item=value, column_id=None
-                ).as_string
+                if get_value_model(item=value, column_id=None).as_string == request.name
             ),
             len(string_items),
         )
@@ -243,21 +282,10 @@ def select_combobox_item(request: ComboBoxRequest):
         logger.error(message)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
     else:
-        try:
-            # Set the index of the combobox model
-            combobox_model._current_index.as_int = str_index
-        except Exception:
-            try:
-                combobox_model.get_item_value_model().as_int = str_index
-            except Exception:
-                # Set the index of the combobox model if the above fails
-                combobox_model.get_item_value_model(
-                    item=None, column_id=None
-                ).as_int = str_index
-
-        value = combobox_model.get_item_value_model(
-            string_items[str_index], 0
-        ).as_string
+        # Set the index of the combobox model
+        call_combobox_model(combobox_model, CURRENT_INDEX_WRITE_CALLS, str_index)
+
+        value = get_value_model(string_items[str_index], 0).as_string
 
         # Log an info message
         message = f"Selected item at index {str_index} with value {value}."
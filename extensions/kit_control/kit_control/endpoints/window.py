@@ -10,8 +10,9 @@
 
 
 import logging
-from typing import Dict
+from typing import Dict, List, Optional
 
+import omni.appwindow
 import omni.ui as ui
 from fastapi import HTTPException, status
 from omni.services.core import routers
@@ -23,11 +24,72 @@ from ..api_models.window_models import (
     WindowListResponse,
 )
 from ..utils.element_cache import element_cache
+from ..utils.json_utils import DefaultJSONResponse
 from ..utils.omnielement import OmniElement
 
 logger = logging.getLogger("kit_control")
 
-router = routers.ServiceAPIRouter()
+router = routers.ServiceAPIRouter(default_response_class=DefaultJSONResponse)
+
+# Widget types accepted as windows by the window endpoints
+WINDOW_TYPES = (ui._ui.Window, ui.Window)
+
+# Dock positions keyed by their upper case name, e.g. LEFT, RIGHT, TOP, BOTTOM, SAME
+DOCK_POSITIONS = {
+    name.upper(): position for name, position in ui.DockPosition.__members__.items()
+}
+
+
+def windows_by_title() -> Dict[str, List[ui.Window]]:
+    """
+    Groups all workspace windows by their title in a single pass.
+
+    Returns:
+        Dict[str, List[ui.Window]]: A dictionary mapping each window title to the windows with that title.
+    """
+    index = {}
+    for window in ui.Workspace.get_windows():
+        index.setdefault(window.title, []).append(window)
+    return index
+
+
+def find_window(window_name: str, index: Optional[Dict[str, List[ui.Window]]] = None):
+    """
+    Finds a window by its title.
+
+    The first visible window with the given title is returned. If no visible window is found,
+    the matching window is returned only when the title is unique.
+
+    Parameters:
+        window_name (str): The title of the window to find.
+        index (Dict[str, List[ui.Window]], optional): A prebuilt title index from `windows_by_title`, used
+            when several windows are looked up in the same request. If not provided, the workspace
+            windows are scanned once and the scan stops at the first visible match.
+
+    Returns:
+        The matching window, or None if no suitable window is found.
+    """
+    windows = (
+        index.get(window_name, []) if index is not None else ui.Workspace.get_windows()
+    )
+    first = None
+    count = 0
+    for window in windows:
+        if window.title == window_name:
+            if window.visible:
+                return window
+            if first is None:
+                first = window
+            count += 1
+    if count == 1:
+        return first
+    if count > 1:
+        logger.warn(
+            'Found %d windows named "%s" and none of them is visible',
+            count,
+            window_name,
+        )
+    return None
 
 
 @router.get("/windows/", response_model=WindowListResponse, tags=["Window"])
@@ -47,18 +109,13 @@ async def windows():
     
         HTTPException: If unable to retrieve list of windows.
     """
-    visible_window_list = []
-    all_windows_list = []
-
     try:
         windows = ui.Workspace.get_windows()
-        for window in windows:
-            if window.visible == True:
-                visible_window_list.append(window.title)
-            all_windows_list.append(window.title)
+        all_windows_list = [window.title for window in windows]
+        visible_window_list = [window.title for window in windows if window.visible]
         logger.info("Windows retrieved successfully.")
-        return WindowListResponse(
-            visible_windows=visible_window_list, all_windows=all_windows_list
+        return DefaultJSONResponse(
+            {"visible_windows": visible_window_list, "all_windows": all_windows_list}
         )
     except Exception as e:
         logger.error(f"Error while retrieving windows: {str(e)}")
@@ -95,27 +152,23 @@ async def window_position(identifier: str, x: float, y: float):
     
         HTTPException: If the element is not a window or if the element is not found in the cache.
     """
-    try:
-        element: OmniElement = element_cache.get_cached_element(identifier)
-        if (
-            ui._ui.Window in element.widget.__class__.__bases__
-            or ui.Window in element.widget.__class__.__bases__
-            or isinstance(element.widget, (ui._ui.Window, ui.Window))
-        ):
-            element.widget.position_x = x
-            element.widget.position_y = y
-            msg = f"Set window position as ({x},{y}) for window at {element.realpath}"
-            logger.info(msg)
-            return MessageResponse(message=msg)
-        else:
-            msg = f"Element is not of type Window, actual type is {element.get_type}"
-            logger.error(msg)
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=msg)
-    except KeyError:
+    element: OmniElement = element_cache.get(identifier)
+    if element is None:
         msg = f"Element with ID {identifier} not found in element cache."
         logger.error(msg)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
 
+    if isinstance(element.widget, WINDOW_TYPES):
+        element.widget.position_x = x
+        element.widget.position_y = y
+        msg = f"Set window position as ({x},{y}) for window at {element.realpath}"
+        logger.info(msg)
+        return MessageResponse(message=msg)
+    else:
+        msg = f"Element is not of type Window, actual type is {element.get_type}"
+        logger.error(msg)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=msg)
+
 
 @router.post(
     "/close_window/",
@@ -141,23 +194,8 @@ async def close_window(window_name: str):
     
         HTTPException: If the window is not found or an error occurs while closing the window.
     """
-    windows = ui.Workspace.get_windows()
-    window_list = []
-    for window in windows:
-        if window.title == window_name:
-            window_list.append(window)
     try:
-        if len(window_list) == 1:
-            window = window_list[0]
-        else:
-            logger.warn(
-                f'found {len(window_list)} windows named "{window_name}". Using first visible window found'
-            )
-            window = None
-            for win in window_list:
-                if win.visible:
-                    window = win
-                    break
+        window = find_window(window_name)
         if window:
             window.visible = False
             msg = f"{window_name} window closed."
@@ -166,11 +204,13 @@ async def close_window(window_name: str):
         else:
             msg = f'Failed to find visible window: "{window_name}"'
             logger.error(msg)
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, details=msg)
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
+    except HTTPException:
+        raise
     except Exception:
         msg = f'Error occured while closing window: "{window_name}"'
         logger.error(msg)
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, details=msg)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
 
 
 @router.post(
@@ -179,7 +219,7 @@ async def close_window(window_name: str):
     status_code=status.HTTP_201_CREATED,
     tags=["Window"],
 )
-def resize_window(request: ResizeWindowRequest):
+async def resize_window(request: ResizeWindowRequest):
     """
         Resizes the specified window to the given height and width.
     The ID received in response of query API is used to find the window and resize it.
@@ -203,18 +243,22 @@ def resize_window(request: ResizeWindowRequest):
         element: OmniElement = element_cache.get_cached_element(request.id)
         element.change_height(request.new_height)
         element.change_width(request.new_width)
-        if element.width == request.new_width and element.height == request.new_height:
-            msg = f"Resize window {element.realpath} to height {element.height} and width {element.width}"
+        width = element.width
+        height = element.height
+        if width == request.new_width and height == request.new_height:
+            msg = (
+                f"Resize window {element.realpath} to height {height} and width {width}"
+            )
             logger.info(msg)
             return MessageResponse(message=msg)
         else:
-            msg = f"Resize window operation failed. Height Expected: {request.new_height} Actual:{element.height} Width Expected: {request.new_width} Actual:{element.width}"
+            msg = f"Resize window operation failed. Height Expected: {request.new_height} Actual:{height} Width Expected: {request.new_width} Actual:{width}"
             logger.error(msg)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg
             )
     except KeyError:
-        msg = f"Element with ID {id} not found in element cache."
+        msg = f"Element with ID {request.id} not found in element cache."
         logger.error(msg)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
 
@@ -244,13 +288,27 @@ async def dock_window(request: DockWindowRequest):
 
     Raises:
     
+        HTTPException(400): If the dock position is not valid.
         HTTPException(404): If either of the windows with the given IDs is not found.
     """
-    win_to_be_docked = ui.Workspace.get_window(request.first_window)
-    win_to_dock_into = ui.Workspace.get_window(request.second_window)
-    win_to_be_docked.dock_in(
-        win_to_dock_into, ui.DockPosition.__members__.get(request.dock_position.upper())
-    )
+    dock_position = DOCK_POSITIONS.get(request.dock_position.upper())
+    if dock_position is None:
+        msg = f"Invalid dock position {request.dock_position}, expected one of {list(DOCK_POSITIONS)}"
+        logger.error(msg)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=msg)
+
+    index = windows_by_title()
+    win_to_be_docked = find_window(request.first_window, index)
+    win_to_dock_into = find_window(request.second_window, index)
+    if win_to_be_docked is None or win_to_dock_into is None:
+        missing = (
+            request.first_window if win_to_be_docked is None else request.second_window
+        )
+        msg = f'Failed to find window: "{missing}"'
+        logger.error(msg)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
+
+    win_to_be_docked.dock_in(win_to_dock_into, dock_position)
     msg = f"{request.first_window} docked into {request.second_window} with dock position as {request.dock_position}"
     logger.info(msg)
     return MessageResponse(message=msg)
@@ -277,42 +335,31 @@ async def window_dimensions(window_name: str):
     
         HTTPException(404): If the specified window is not found.
     """
-    windows = ui.Workspace.get_windows()
-    window_list = []
-    for window in windows:
-        if window.title == window_name:
-            window_list.append(window)
     try:
-        if len(window_list) == 1:
-            window = window_list[0]
-        else:
-            logger.warn(
-                f'Found {len(window_list)} windows named "{window_name}". Using first visible window found'
-            )
-            window = None
-            for win in window_list:
-                if win.visible:
-                    window = win
-                    break
+        window = find_window(window_name)
         if window:
             height = window.height
             width = window.width
             position_x = window.position_x
             position_y = window.position_y
-            return {
-                "width": width,
-                "height": height,
-                "position_x": position_x,
-                "position_y": position_y,
-            }
+            return DefaultJSONResponse(
+                {
+                    "width": width,
+                    "height": height,
+                    "position_x": position_x,
+                    "position_y": position_y,
+                }
+            )
         else:
             msg = f'Failed to find visible window: "{window_name}"'
             logger.error(msg)
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, details=msg)
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
+    except HTTPException:
+        raise
     except Exception:
         msg = f'Error occured while fetching dimensions of window: "{window_name}"'
         logger.error(msg)
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, details=msg)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
 
 
 @router.get("/app_window_dimension/", response_model=Dict[str, str], tags=["Window"])
@@ -330,8 +377,6 @@ async def app_win_dimension() -> Dict[str, int]:
     
         HTTPException(404): If unable to get dimensions.
     """
-    import omni.appwindow
-
     app_width = 0
     app_height = 0
     main_win_width = 0
@@ -18,6 +18,7 @@ from omni.services.core import main
 
 from .endpoints.coverage import router as coverage_router
 from .endpoints.extension import router as extension_router
+from .endpoints.extension import shutdown_extension_executor
 from .endpoints.keyboard import router as keyboard_router
 from .endpoints.live_session import router as live_session
 from .endpoints.menu import router as menu_router
@@ -30,6 +31,7 @@ from .endpoints.viewport import router as viewport_router
 from .endpoints.widget import router as widget_router
 from .endpoints.window import router as window_router
 from .utils.logging import logging_init
+from .utils.usd_helper import reset_xform_cache
 
 
 class KITControlExtension(omni.ext.IExt):
@@ -102,7 +104,7 @@ class KITControlExtension(omni.ext.IExt):
         - live_session
         - misc
 
-        After deregistering all routers, it logs a successful de-registration message.
+        After deregistering all routers, it clears the xform cache, shuts down the extension executor and logs a successful de-registration message.
 
         Raises:
         Any exceptions raised by the deregister_router method."""
@@ -119,6 +121,8 @@ class KITControlExtension(omni.ext.IExt):
         main.deregister_router(router=extension_router)
         main.deregister_router(router=live_session)
         main.deregister_router(router=misc)
+        reset_xform_cache()
+        shutdown_extension_executor()
         self.logger.info(
             "Successfully de-registered kit_control extension router in to omni.services.core main router."
         )
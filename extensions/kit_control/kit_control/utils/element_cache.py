@@ -11,7 +11,7 @@
 
 import logging
 import uuid
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 
 from ..utils.omnielement import OmniElement
 
@@ -69,6 +69,15 @@ class ElementCache:
         """
         return self.element_map
 
+    def is_empty(self) -> bool:
+        """
+        Checks whether the cache holds any elements.
+
+        Returns:
+            bool: True if the cache is empty, False otherwise.
+        """
+        return not self.element_map
+
     def reset_map(self) -> None:
         """
         Resets the map.
@@ -105,5 +114,20 @@ class ElementCache:
         else:
             raise KeyError
 
+    def get(
+        self, identifier: str, default: Optional[OmniElement] = None
+    ) -> Optional[OmniElement]:
+        """
+        Retrieves a cached element using its identifier without raising.
+
+        Parameters:
+            identifier: A string representing the unique identifier of the element.
+            default: The value to return if the identifier is not found in the cache. Default is None.
+
+        Returns:
+            Optional[OmniElement]: The cached element with the given identifier, or the default value.
+        """
+        return self.element_map.get(identifier, default)
+
 
 element_cache = ElementCache()
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: LicenseRef-NvidiaProprietary
+#
+# NVIDIA CORPORATION, its affiliates and licensors retain all intellectual
+# property and proprietary rights in and to this material, related
+# documentation and any modifications thereto. Any use, reproduction,
+# disclosure or distribution of this material and related documentation
+# without an express license agreement from NVIDIA CORPORATION or
+# its affiliates is strictly prohibited.
+
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+# orjson is optional, it is used for faster serialization when it is installed in the app
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Response class of the routers, ORJSONResponse if orjson is installed and JSONResponse otherwise
+DefaultJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serializes an object to compact JSON.
+
+    orjson is used if it is installed, otherwise the standard json module with the same compact
+    separators as JSONResponse. Non string dictionary keys are converted to strings by both.
+
+    Parameters:
+        obj (Any): The JSON serializable object.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
@@ -11,10 +11,15 @@
 
 import logging
 import os
+import sys
 
 
 logger = logging.getLogger("kit_control")
 
+FORMATTER = logging.Formatter(
+    "%(asctime)s [%(name)s] [%(levelname)s] [%(filename)s] [%(funcName)s %(lineno)s] - %(message)s"
+)
+
 
 def logging_init(level):
     """
@@ -23,31 +28,20 @@ def logging_init(level):
     Args:
         level (int): The logging level to use.
     """
-    import logging
-    import sys
-
     path = get_log_path()
-    file_handler = logging.FileHandler(f"{path}", "a")
-    file_handler.setLevel(logging.INFO)
-    file_handler.name = "file_handler"
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_handler.name = "console_handler"
-
-    logger = logging.getLogger("kit_control")
+
     logger.propagate = False
     if len(logger.handlers) == 0:
-        file_handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s [%(name)s] [%(levelname)s] [%(filename)s] [%(funcName)s %(lineno)s] - %(message)s"
-            )
-        )
+        file_handler = logging.FileHandler(f"{path}", "a")
+        file_handler.setLevel(logging.INFO)
+        file_handler.name = "file_handler"
+        file_handler.setFormatter(FORMATTER)
         logger.addHandler(file_handler)
-        console_handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s [%(name)s] [%(levelname)s] [%(filename)s] [%(funcName)s %(lineno)s] - %(message)s"
-            )
-        )
+
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.name = "console_handler"
+        console_handler.setFormatter(FORMATTER)
         logger.addHandler(console_handler)
     logger.info(f"Logging initialized for kit_control at {path}")
 
@@ -66,15 +60,7 @@ def get_log_path() -> str:
     path = (
         carb.tokens.get_tokens_interface().resolve("${omni_logs}") + "/Kit/kit_control"
     )
+    os.makedirs(path, exist_ok=True)
 
-    if os.path.exists(path):
-        return (
-            path
-            + f"/kit_control_{datetime.now().hour}{datetime.now().minute}{datetime.now().second}.log"
-        )
-    else:
-        os.mkdir(path)
-        return (
-            path
-            + f"/kit_control_{datetime.now().hour}{datetime.now().minute}{datetime.now().second}.log"
-        )
+    suffix = datetime.now().strftime("%H%M%S")
+    return f"{path}/kit_control_{suffix}.log"
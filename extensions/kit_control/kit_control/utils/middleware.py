@@ -22,20 +22,32 @@ class CoreServices(main.ServicesCoreExtension):
 logger = logging.getLogger("kit_control")
 core_services = CoreServices()
 
+# Maximum number of response body bytes written to the log at DEBUG level
+MAX_LOG_BYTES = 4096
+
 
 @core_services.app.middleware("http")
 async def log_api(request, call_next):
     response = await call_next(request)
-    body = b""
+    path = request.url.path
+    if path.endswith("/openapi.json") or path.startswith("/docs"):
+        return response
+
+    logger.info(f"{request.method} {request.url}")
+    logger.info(f"Status code: {response.status_code}")
+
+    if not logger.isEnabledFor(logging.DEBUG):
+        return response
+
+    # Body logging requires draining the iterator, so only do it at DEBUG level
+    # and re-wrap the complete body; only the first MAX_LOG_BYTES are logged.
+    body = bytearray()
     async for chunk in response.body_iterator:
-        body += chunk
-    if "openapi.json" not in str(request.url) and "docs" not in str(request.url):
-        logger.info(f"{request.method} {request.url}")
-        logger.info(f"Status code: {response.status_code}")
-        logger.info(body)
+        body.extend(chunk)
+    logger.debug(bytes(body[:MAX_LOG_BYTES]))
 
     return Response(
-        content=body,
+        content=bytes(body),
         status_code=response.status_code,
         headers=dict(response.headers),
         media_type=response.media_type,
@@ -9,7 +9,11 @@
 # its affiliates is strictly prohibited.
 
 
+import asyncio
 import logging
+import sys
+import time
+from functools import cached_property
 from typing import Any, Tuple, Union
 
 import omni.appwindow
@@ -28,22 +32,56 @@ from omni.kit.ui_test.vec2 import Vec2
 
 logger = logging.getLogger("kit_control")
 
+# Default for getattr lookups, distinguishes a missing attribute from one set to None
+_MISSING = object()
 
-async def wrapper_function(event_type: MouseEventType, pos: Vec2 = Vec2()):
-    """
-    A wrapper function for emulating a mouse event.
+# Value reported by get_properties for properties the widget type does not support
+NOT_AVAILABLE = sys.intern("N/A")
 
-    This function is a wrapper around the `emulate_mouse_without_cursor` function.
-    It is used to emulate a mouse event of the given type at the specified position.
+# Base classes of the omni.ui widgets that carry a value or item model
+MODEL_WIDGET_TYPES = (ui.ValueModelHelper, ui.ItemModelHelper)
+
+
+# Seconds during which the cached main window size and DPI scale are reused
+WINDOW_METRICS_TTL = 0.25
+
+# DPI scale and the factors mapping a logical position to normalized window coordinates,
+# refreshed at most once per WINDOW_METRICS_TTL
+window_metrics_cache = {"dpi": None, "x_scale": None, "y_scale": None, "time": 0.0}
 
-    Parameters:
-        event_type (MouseEventType): The type of the mouse event.
-        pos (Vec2, optional): The position of the mouse event. Defaults to Vec2().
+
+def get_window_metrics() -> Tuple[float, float, float]:
+    """
+    Returns the DPI scale and the normalization factors of the main window.
+
+    The normalization factors are the DPI scale divided by the main window width and height, so a
+    logical position maps to normalized window coordinates with one multiplication per axis.
+    The values are queried from the workspace at most once per WINDOW_METRICS_TTL seconds, so bursts
+    of mouse events reuse them instead of querying them for every event.
 
     Returns:
-        None
+        Tuple[float, float, float]: The DPI scale and the x and y normalization factors.
     """
-    await emulate_mouse_without_cursor(event_type, pos)
+    now = time.monotonic()
+    if now - window_metrics_cache["time"] > WINDOW_METRICS_TTL:
+        dpi_scale = ui.Workspace.get_dpi_scale()
+        window_metrics_cache["dpi"] = dpi_scale
+        window_metrics_cache["x_scale"] = (
+            dpi_scale / ui.Workspace.get_main_window_width()
+        )
+        window_metrics_cache["y_scale"] = (
+            dpi_scale / ui.Workspace.get_main_window_height()
+        )
+        window_metrics_cache["time"] = now
+    return (
+        window_metrics_cache["dpi"],
+        window_metrics_cache["x_scale"],
+        window_metrics_cache["y_scale"],
+    )
+
+
+# carb input provider the emulated mouse events are buffered into, resolved on first use
+input_provider = None
 
 
 async def emulate_mouse_without_cursor(event_type: MouseEventType, pos: Vec2 = Vec2()):
@@ -61,34 +99,48 @@ async def emulate_mouse_without_cursor(event_type: MouseEventType, pos: Vec2 = V
     Returns:
         None
     """
+    global input_provider
+    if input_provider is None:
+        input_provider = ui_test.input._get_input_provider()
     app_window = omni.appwindow.get_default_app_window()
     mouse = app_window.get_mouse()
-    window_width = ui.Workspace.get_main_window_width()
-    window_height = ui.Workspace.get_main_window_height()
-    pos = pos * ui.Workspace.get_dpi_scale()
-    ui_test.input._get_input_provider().buffer_mouse_event(
+    dpi_scale, x_scale, y_scale = get_window_metrics()
+    x, y = pos.x, pos.y
+    input_provider.buffer_mouse_event(
         mouse,
         event_type,
-        (pos.x / window_width, pos.y / window_height),
+        (x * x_scale, y * y_scale),
         0,
-        pos.to_tuple(),
+        (x * dpi_scale, y * dpi_scale),
     )
 
 
+# Serializes emulated mouse move and click sequences, so concurrent clicks do not interleave their moves
+mouse_click_lock = asyncio.Lock()
+
+
 async def emulate_mouse_move_and_click(
-    pos: Vec2, right_click=False, double=False, human_delay_speed: int = 2
+    pos: Vec2,
+    right_click=False,
+    double=False,
+    human_delay_speed: int = 2,
 ):
-    """Emulate Mouse move into position and click."""
+    """
+    Emulate Mouse move into position and click.
+
+    The move and the click are sent under `mouse_click_lock`, so a concurrent click waits for this one.
+    """
     logger.info(
         f"emulate_mouse_move_and_click pos: {pos} (right_click: {right_click}, double: {double})"
     )
-    await emulate_mouse(MouseEventType.MOVE, pos)
-    await human_delay(human_delay_speed)
-    await emulate_mouse_click(right_click=right_click, double=double)
-    await human_delay(human_delay_speed)
+    async with mouse_click_lock:
+        await emulate_mouse(MouseEventType.MOVE, pos)
+        await human_delay(human_delay_speed)
+        await emulate_mouse_click(right_click=right_click, double=double)
+        await human_delay(human_delay_speed)
 
 
-ui_test.input.emulate_mouse = wrapper_function
+ui_test.input.emulate_mouse = emulate_mouse_without_cursor
 
 
 class OmniElement(WidgetRef):
@@ -183,6 +235,60 @@ class OmniElement(WidgetRef):
             Emulates a mouse click on the UI element.
     """
 
+    # Properties reported by get_properties, in the order they appear in the result
+    _PROPERTY_NAMES = (
+        "name",
+        "visible",
+        "enabled",
+        "height",
+        "width",
+        "str_value",
+        "int_value",
+        "float_value",
+        "bool_value",
+        "get_type",
+        "collapsed",
+        "slider_range",
+        "center",
+        "text",
+        "selected",
+        "checked",
+        "dock",
+        "value",
+        "canvas",
+        "screen_position_x",
+        "screen_position_y",
+    )
+
+    # Properties get_properties reads directly off the widget
+    _WIDGET_ATTRIBUTES = frozenset(
+        (
+            "name",
+            "visible",
+            "enabled",
+            "collapsed",
+            "screen_position_x",
+            "screen_position_y",
+        )
+    )
+
+    # Model getters backing the value properties
+    _MODEL_GETTERS = {
+        "str_value": "get_value_as_string",
+        "int_value": "get_value_as_int",
+        "float_value": "get_value_as_float",
+        "bool_value": "get_value_as_bool",
+    }
+
+    # Properties read off the widget that fall back to a model value when the widget lacks the attribute
+    _MODEL_FALLBACK_ATTRIBUTES = frozenset(("text", "selected", "checked"))
+
+    # Window and widget attributes backing the size properties
+    _SIZE_ATTRIBUTES = {
+        "width": ("width", "computed_width"),
+        "height": ("height", "computed_content_height"),
+    }
+
     def __init__(self, element: ui_test.WidgetRef) -> None:
         """
         Initializes the instance with a given widget reference.
@@ -193,6 +299,35 @@ class OmniElement(WidgetRef):
         Raises:
         TypeError: If the provided element is not a ui_test.WidgetRef."""
         super().__init__(element.widget, element.path)
+        self._is_window = isinstance(element.widget, ui.Window)
+        self._is_canvas = isinstance(element.widget, ui.CanvasFrame)
+        self._has_model = isinstance(element.widget, MODEL_WIDGET_TYPES)
+        # Common tail of the error messages returned for missing attributes, built on the first error
+        self._err_suffix = None
+        # Error messages already built for this element, keyed by message prefix
+        self._err_messages = {}
+
+    def _attribute_error(self, prefix: str) -> str:
+        """
+        Logs and returns the error message for an attribute missing on the widget.
+
+        The message is built once per prefix and the same string is returned on later failures, so
+        repeated property sweeps over an element do not allocate new messages. The path is only
+        converted to a string on the first error, so elements without missing attributes never format it.
+
+        Parameters:
+            prefix (str): The start of the message naming the missing attribute.
+
+        Returns:
+            str: The error message.
+        """
+        message = self._err_messages.get(prefix)
+        if message is None:
+            if self._err_suffix is None:
+                self._err_suffix = f" on the {self.get_type} at path {self.path}."
+            message = self._err_messages[prefix] = prefix + self._err_suffix
+        logger.error(message)
+        return message
 
     @property
     def name(self) -> str:
@@ -205,14 +340,10 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the 'enabled' attribute is not found on the widget or window.
         """
-        try:
-            return self.widget.name
-        except AttributeError:
-            message = (
-                f"The 'name' not found on the {self.get_type} at path {self.path}."
-            )
-            logger.error(message)
-            return message
+        name = getattr(self.widget, "name", _MISSING)
+        if name is _MISSING:
+            return self._attribute_error("The 'name' not found")
+        return name
 
     @property
     def visible(self) -> bool:
@@ -236,14 +367,10 @@ class OmniElement(WidgetRef):
             AttributeError: If the 'enabled' attribute is not found on the widget or window.
         """
 
-        try:
-            return self.widget.enabled
-        except AttributeError:
-            message = (
-                f"The 'enabled' not found on the {self.get_type} at path {self.path}."
-            )
-            logger.error(message)
-            return message
+        enabled = getattr(self.widget, "enabled", _MISSING)
+        if enabled is _MISSING:
+            return self._attribute_error("The 'enabled' not found")
+        return enabled
 
     @property
     def width(self) -> Union[float, Tuple[int, str]]:
@@ -256,15 +383,13 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the 'width' attribute is not found on the widget or window.
         """
-        try:
-            if "window" not in str(type(self.widget)).lower():
-                return self.widget.computed_width
-            else:
-                return self.window.width
-        except Exception:
-            message = f"The 'width' attribute is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+        if self._is_window:
+            width = getattr(self.window, "width", _MISSING)
+        else:
+            width = getattr(self.widget, "computed_width", _MISSING)
+        if width is _MISSING:
+            return self._attribute_error("The 'width' attribute is not found")
+        return width
 
     @property
     def height(self) -> Union[float, Tuple[int, str]]:
@@ -279,15 +404,13 @@ class OmniElement(WidgetRef):
         Raises:
             - An error message is logged if the height attribute is not found.
         """
-        try:
-            if "window" not in str(type(self.widget)).lower():
-                return self.widget.computed_content_height
-            else:
-                return self.window.height
-        except Exception:
-            message = f"The 'height' attribute is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+        if self._is_window:
+            height = getattr(self.window, "height", _MISSING)
+        else:
+            height = getattr(self.widget, "computed_content_height", _MISSING)
+        if height is _MISSING:
+            return self._attribute_error("The 'height' attribute is not found")
+        return height
 
     @property
     def str_value(self) -> str:
@@ -300,12 +423,15 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the 'model' attribute is not found.
         """
-        try:
-            return self.model.get_value_as_string()
-        except AttributeError:
-            message = f"The 'str_value' attribute requires 'model' attribute to be present which is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+        getter = getattr(getattr(self, "model", None), "get_value_as_string", None)
+        if getter is not None:
+            try:
+                return getter()
+            except AttributeError:
+                pass
+        return self._attribute_error(
+            "The 'str_value' attribute requires 'model' attribute to be present which is not found"
+        )
 
     @property
     def int_value(self) -> int:
@@ -318,12 +444,15 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the 'model' attribute is not found on the object.
         """
-        try:
-            return self.model.get_value_as_int()
-        except AttributeError:
-            message = f"The 'int_value' attribute requires 'model' attribute to be present which is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+        getter = getattr(getattr(self, "model", None), "get_value_as_int", None)
+        if getter is not None:
+            try:
+                return getter()
+            except AttributeError:
+                pass
+        return self._attribute_error(
+            "The 'int_value' attribute requires 'model' attribute to be present which is not found"
+        )
 
     @property
     def float_value(self) -> float:
@@ -336,12 +465,15 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the 'model' attribute is not found.
         """
-        try:
-            return self.model.get_value_as_float()
-        except AttributeError:
-            message = f"The 'float_value' attribute requires 'model' attribute to be present which is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+        getter = getattr(getattr(self, "model", None), "get_value_as_float", None)
+        if getter is not None:
+            try:
+                return getter()
+            except AttributeError:
+                pass
+        return self._attribute_error(
+            "The 'float_value' attribute requires 'model' attribute to be present which is not found"
+        )
 
     @property
     def bool_value(self) -> float:
@@ -354,22 +486,42 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the 'model' attribute is not found.
         """
-        try:
-            return self.model.get_value_as_bool()
-        except AttributeError:
-            message = f"The 'bool_value' attribute requires 'model' attribute to be present which is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+        getter = getattr(getattr(self, "model", None), "get_value_as_bool", None)
+        if getter is not None:
+            try:
+                return getter()
+            except AttributeError:
+                pass
+        return self._attribute_error(
+            "The 'bool_value' attribute requires 'model' attribute to be present which is not found"
+        )
 
-    @property
+    @cached_property
     def get_type(self) -> str:
         """
         Returns the type of the widget as a string.
 
+        The value is computed on first access and cached on the instance.
+
         Returns:
             str: The type of the widget.
         """
-        return str(self.widget.__class__.__name__)
+        return self.widget.__class__.__name__
+
+    @property
+    def combobox_model(self):
+        """
+        Gets the model of a combobox widget.
+
+        The model is looked up on the element first and then on the widget delegate. It is not stored,
+        since the widget model can be replaced while the element stays cached.
+
+        Returns:
+            The combobox model, or None if the element does not expose one.
+        """
+        return getattr(self, "model", None) or getattr(
+            getattr(self.widget, "delegate", None), "_model", None
+        )
 
     @property
     def collapsed(self) -> Union[bool, Tuple[int, str]]:
@@ -382,12 +534,10 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the 'collapsed' attribute is not found on the widget.
         """
-        try:
-            return self.widget.collapsed
-        except AttributeError:
-            message = f"The 'collapsed' attribute is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+        collapsed = getattr(self.widget, "collapsed", _MISSING)
+        if collapsed is _MISSING:
+            return self._attribute_error("The 'collapsed' attribute is not found")
+        return collapsed
 
     @property
     def slider_range(self) -> Union[Tuple[float, float], Tuple[int, str]]:
@@ -400,17 +550,17 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the 'min' or 'max' attributes are not found on the widget.
         """
-        try:
-            min = self.widget.min
-            max = self.widget.max
-        except AttributeError:
-            try:
-                min = self.widget.delegate._SliderMenuDelegate__slider.min
-                max = self.widget.delegate._SliderMenuDelegate__slider.max
-            except AttributeError:
-                message = f"The 'min, max' attributes are not found on the {self.get_type} at path {self.path}."
-                logger.error(message)
-                return message
+        slider = self.widget
+        min = getattr(slider, "min", _MISSING)
+        max = getattr(slider, "max", _MISSING)
+        if min is _MISSING or max is _MISSING:
+            # Sliders shown in menus keep the slider widget on their delegate
+            delegate = getattr(slider, "delegate", None)
+            slider = getattr(delegate, "_SliderMenuDelegate__slider", None)
+            min = getattr(slider, "min", _MISSING)
+            max = getattr(slider, "max", _MISSING)
+            if min is _MISSING or max is _MISSING:
+                return self._attribute_error("The 'min, max' attributes are not found")
         return (min, max)
 
     @property
@@ -425,12 +575,11 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the 'center' attribute is not found on the object.
         """
-        try:
-            return self.position + self.size / 2
-        except AttributeError:
-            message = f"The 'center' attribute is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+        position = getattr(self, "position", None)
+        size = getattr(self, "size", None)
+        if position is None or size is None:
+            return self._attribute_error("The 'center' attribute is not found")
+        return Vec2(position.x + size.x * 0.5, position.y + size.y * 0.5)
 
     @property
     def text(self) -> Union[str, Tuple[int, str]]:
@@ -443,15 +592,11 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the text attribute is not found on the widget.
         """
-        try:
-            return self.widget.text
-        except AttributeError:
-            try:
-                return self.str_value
-            except AttributeError:
-                message = f"The 'text' attribute is not found on the {self.get_type} at path {self.path}."
-                logger.error(message)
-                return message
+        text = getattr(self.widget, "text", _MISSING)
+        if text is _MISSING:
+            # Falls back to the model value, which returns its own error message without a model
+            return self.str_value
+        return text
 
     @property
     def selected(self) -> Union[bool, Tuple[int, str]]:
@@ -464,15 +609,11 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the 'selected' attribute is not found on the widget or the 'bool_value' attribute is not found.
         """
-        try:
-            return self.widget.selected
-        except AttributeError:
-            try:
-                return self.bool_value
-            except AttributeError:
-                message = f"The 'text' attribute is not found on the {self.get_type} at path {self.path}."
-                logger.error(message)
-                return message
+        selected = getattr(self.widget, "selected", _MISSING)
+        if selected is _MISSING:
+            # Falls back to the model value, which returns its own error message without a model
+            return self.bool_value
+        return selected
 
     @property
     def checked(self) -> Union[bool, Tuple[int, str]]:
@@ -486,15 +627,11 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the attribute is not found.
         """
-        try:
-            return self.widget.checked
-        except AttributeError:
-            try:
-                return self.bool_value
-            except AttributeError:
-                message = f"The 'checked' attribute is not found on the {self.get_type} at path {self.path}."
-                logger.error(message)
-                return message
+        checked = getattr(self.widget, "checked", _MISSING)
+        if checked is _MISSING:
+            # Falls back to the model value, which returns its own error message without a model
+            return self.bool_value
+        return checked
 
     @property
     def dock(self) -> Union[Tuple[bool, int, int], Tuple[int, str]]:
@@ -514,9 +651,7 @@ class OmniElement(WidgetRef):
             dock_id = self.window.dock_id
             return (dock_status, dock_order, dock_id)
         except AttributeError:
-            message = f"The 'dock' attribute is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+            return self._attribute_error("The 'dock' attribute is not found")
 
     @property
     def value(self) -> Union[Any, Tuple[int, str]]:
@@ -532,9 +667,7 @@ class OmniElement(WidgetRef):
         try:
             return self.widget.value()
         except AttributeError:
-            message = f"The 'value' attribute is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+            return self._attribute_error("The 'value' attribute is not found")
 
     @property
     def alignment(self) -> Union[Any, Tuple[int, str]]:
@@ -547,12 +680,10 @@ class OmniElement(WidgetRef):
         Raises:
             AttributeError: If the 'alignment' attribute is not found on the widget.
         """
-        try:
-            return self.widget.alignment
-        except AttributeError:
-            message = f"The 'alignment' attribute is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+        alignment = getattr(self.widget, "alignment", _MISSING)
+        if alignment is _MISSING:
+            return self._attribute_error("The 'alignment' attribute is not found")
+        return alignment
 
     @property
     def canvas(self) -> Union[Tuple[float, float, float, float], Tuple[int, str]]:
@@ -566,15 +697,15 @@ class OmniElement(WidgetRef):
         Raises:
             - None
         """
-        if type(self.widget) == ui.CanvasFrame:
+        if self._is_canvas:
             zoom = self.widget.zoom
             pan_x = self.widget.pan_x
             pan_y = self.widget.pan_y
             return (zoom, pan_x, pan_y)
         else:
-            message = f"The 'canvas properties' attribute is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+            return self._attribute_error(
+                "The 'canvas properties' attribute is not found"
+            )
 
     @property
     def screen_position_x(self) -> Union[float, Tuple[int, str]]:
@@ -591,9 +722,9 @@ class OmniElement(WidgetRef):
         try:
             return self.widget.screen_position_x
         except Exception:
-            message = f"The 'screen_position_x' attribute is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+            return self._attribute_error(
+                "The 'screen_position_x' attribute is not found"
+            )
 
     @property
     def screen_position_y(self) -> Union[float, Tuple[int, str]]:
@@ -610,9 +741,9 @@ class OmniElement(WidgetRef):
         try:
             return self.widget.screen_position_y
         except Exception:
-            message = f"The 'screen_position_y' attribute is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+            return self._attribute_error(
+                "The 'screen_position_y' attribute is not found"
+            )
 
     @property
     def widget_position(self):
@@ -628,9 +759,7 @@ class OmniElement(WidgetRef):
         try:
             self.position.to_tuple()
         except Exception:
-            message = f"The 'position' attribute is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+            return self._attribute_error("The 'position' attribute is not found")
 
     @property
     def widget_size(self):
@@ -646,9 +775,7 @@ class OmniElement(WidgetRef):
         try:
             self.size.to_tuple()
         except Exception:
-            message = f"The 'size' attribute is not found on the {self.get_type} at path {self.path}."
-            logger.error(message)
-            return message
+            return self._attribute_error("The 'size' attribute is not found")
 
     def change_height(self, value: float):
         """
@@ -695,7 +822,10 @@ class OmniElement(WidgetRef):
         """
         Emulate mouse click on the widget."""
         if bring_to_front:
-            await self.bring_to_front()
+            # A window that is still focused is not brought to front again
+            window = self.window
+            if window is None or not window.focused:
+                await self.bring_to_front()
         if not pos:
             if self.enabled and self.visible:
                 pos = self.center
@@ -706,6 +836,53 @@ class OmniElement(WidgetRef):
             human_delay_speed=human_delay_speed,
         )
 
+    def _collect_properties_fast(self) -> dict:
+        """
+        Collects the values of the properties listed in _PROPERTY_NAMES.
+
+        The widget, model and window are resolved once and their attributes are read with getattr
+        defaults instead of going through one try/except per property. Properties that are not
+        plain attribute reads, whose attribute is missing or whose model getter fails, fall back to
+        the property itself, which logs and returns the error message. For widgets without a model,
+        the value properties, and text, selected and checked when the widget lacks them, are reported
+        as NOT_AVAILABLE without looking the model up.
+
+        Returns:
+            dict: The property values keyed by property name.
+        """
+        w = self.widget
+        m = getattr(w, "model", None) if self._has_model else None
+        sized = self.window if self._is_window else w
+        size_index = 0 if self._is_window else 1
+
+        properties = {}
+        for name in self._PROPERTY_NAMES:
+            value = _MISSING
+            if name in self._WIDGET_ATTRIBUTES:
+                value = getattr(w, name, _MISSING)
+            elif name in self._MODEL_GETTERS:
+                if not self._has_model:
+                    properties[name] = NOT_AVAILABLE
+                    continue
+                getter = getattr(m, self._MODEL_GETTERS[name], None)
+                if getter is not None:
+                    try:
+                        value = getter()
+                    except Exception:
+                        # Read again through the property, which reports model errors
+                        value = _MISSING
+            elif name in self._MODEL_FALLBACK_ATTRIBUTES:
+                value = getattr(w, name, _MISSING)
+                if value is _MISSING and not self._has_model:
+                    properties[name] = NOT_AVAILABLE
+                    continue
+            elif name in self._SIZE_ATTRIBUTES:
+                value = getattr(
+                    sized, self._SIZE_ATTRIBUTES[name][size_index], _MISSING
+                )
+            properties[name] = getattr(self, name) if value is _MISSING else value
+        return properties
+
     def get_properties(self):
         """
         Returns the properties of the object.
@@ -737,32 +914,10 @@ class OmniElement(WidgetRef):
             - real_path: The real path of the object.
             - position: The position of the object as a tuple.
             - size: The size of the object as a tuple."""
-        properties = {
-            "name": self.name,
-            "visible": self.visible,
-            "enabled": self.enabled,
-            "height": self.height,
-            "width": self.width,
-            "str_value": self.str_value,
-            "int_value": self.int_value,
-            "float_value": self.float_value,
-            "bool_value": self.bool_value,
-            "get_type": self.get_type,
-            "collapsed": self.collapsed,
-            "slider_range": self.slider_range,
-            "center": self.center,
-            "text": self.text,
-            "selected": self.selected,
-            "checked": self.checked,
-            "dock": self.dock,
-            "value": self.value,
-            "canvas": self.canvas,
-            "screen_position_x": self.screen_position_x,
-            "screen_position_y": self.screen_position_y,
-            "path": str(self.path) or "",
-            "real_path": str(self.realpath) or "",
-            "position": self.widget_position,
-            "size": self.widget_size,
-        }
+        properties = self._collect_properties_fast()
+        properties["path"] = str(self.path) or ""
+        properties["real_path"] = str(self.realpath) or ""
+        properties["position"] = self.widget_position
+        properties["size"] = self.widget_size
 
         return properties
@@ -11,9 +11,191 @@
 
 import logging
 import html
+import threading
+from collections import OrderedDict
+
+from pxr import Sdf, Tf, Usd, UsdGeom
 
 logger = logging.getLogger("kit_control")
 
+# Rotate xform op attribute names indexed by the integer value of the XformCommonAPI rotation order.
+# The pxr bindings expose TfToken as str, so these constants are the precomputed tokens: set_xform
+# passes them to USD as is instead of building the name for every call.
+ROTATION_ORDER_ATTRIBUTES = tuple(
+    "xformOp:rotate" + axes
+    for _, axes in sorted(
+        (int(getattr(UsdGeom.XformCommonAPI, "RotationOrder" + axes)), axes)
+        for axes in ("XYZ", "XZY", "YXZ", "YZX", "ZXY", "ZYX")
+    )
+)
+
+# Scale xform op attribute name
+SCALE_ATTRIBUTE = "xformOp:scale"
+
+# Prims reported by the visibility queries: active, loaded, defined and non abstract prims, the same
+# prims stage.Traverse() yields. The filtering is done by the prim range in C++.
+VISIBILITY_PRIM_PREDICATE = (
+    Usd.PrimIsActive & Usd.PrimIsLoaded & Usd.PrimIsDefined & ~Usd.PrimIsAbstract
+)
+
+# Maximum number of prims whose xforms are cached per stage, the least recently used prim is dropped
+XFORM_CACHE_SIZE = 1024
+
+# Xform vectors returned by UsdHelper.getXform, by stage, then by prim path in least recently used
+# order, then by time
+xform_cache = {}
+# Objects changed listener of each stage in xform_cache, invalidating its entries on change
+xform_cache_listeners = {}
+# Stage event subscription of the USD context, dropping the cache of its stage when it closes
+xform_cache_stage_subscription = None
+# getXform is called from endpoint handlers and the listeners from USD change notification
+xform_cache_lock = threading.Lock()
+
+
+def drop_stage_xform_cache(stage):
+    """
+    Removes the cached xforms of a stage and revokes its listener.
+
+    Must be called with xform_cache_lock held.
+
+    Parameters:
+        stage: The stage to drop the cached xforms of.
+    """
+    xform_cache.pop(stage, None)
+    listener = xform_cache_listeners.pop(stage, None)
+    if listener is not None:
+        listener.Revoke()
+
+
+def invalidate_xform_cache(stage, resynced_paths, changed_paths):
+    """
+    Removes the cached xforms of a stage affected by a change.
+
+    Property changes invalidate their prim only, since getXform reads the local xform of the prim.
+    Resyncs invalidate the whole resynced subtree. Once no xform of the stage is cached anymore, its
+    listener is revoked so later edits of the stage are not processed.
+
+    Parameters:
+        stage: The stage that changed.
+        resynced_paths: The Sdf paths reported as resynced.
+        changed_paths: The Sdf paths reported as changed without a resync.
+    """
+    with xform_cache_lock:
+        stage_cache = xform_cache.get(stage)
+        if stage_cache is None:
+            return
+        for path in changed_paths:
+            stage_cache.pop(str(path.GetPrimPath()), None)
+        for path in resynced_paths:
+            prim_path = str(path.GetPrimPath())
+            subtree_prefix = prim_path.rstrip("/") + "/"
+            stale_paths = [
+                cached_path
+                for cached_path in stage_cache
+                if cached_path == prim_path or cached_path.startswith(subtree_prefix)
+            ]
+            for cached_path in stale_paths:
+                del stage_cache[cached_path]
+        if not stage_cache:
+            drop_stage_xform_cache(stage)
+
+
+def on_objects_changed(notice, stage):
+    """
+    Usd.Notice.ObjectsChanged listener invalidating the cached xforms of the changed prims.
+
+    Parameters:
+        notice: The objects changed notice.
+        stage: The stage sending the notice.
+    """
+    invalidate_xform_cache(
+        stage, notice.GetResyncedPaths(), notice.GetChangedInfoOnlyPaths()
+    )
+
+
+def on_stage_event(event):
+    """
+    USD context stage event listener dropping the cached xforms of a stage that is closing.
+
+    Parameters:
+        event: The stage event.
+    """
+    import omni.usd as usd
+
+    if event.type == int(usd.StageEventType.CLOSING):
+        stage = usd.get_context().get_stage()
+        with xform_cache_lock:
+            drop_stage_xform_cache(stage)
+
+
+def cache_xform(stage, prim_path: str, time, xform):
+    """
+    Caches the xform of a prim, evicting the least recently used prim of a full stage cache.
+
+    Parameters:
+        stage: The stage holding the prim.
+        prim_path (str): The path of the prim.
+        time: The time of the xform.
+        xform: The xform vectors.
+    """
+    global xform_cache_stage_subscription
+
+    if xform_cache_stage_subscription is None:
+        import omni.usd as usd
+
+        xform_cache_stage_subscription = (
+            usd.get_context()
+            .get_stage_event_stream()
+            .create_subscription_to_pop(on_stage_event, name="kit_control xform cache")
+        )
+    with xform_cache_lock:
+        stage_cache = xform_cache.get(stage)
+        if stage_cache is None:
+            stage_cache = xform_cache[stage] = OrderedDict()
+            xform_cache_listeners[stage] = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged, on_objects_changed, stage
+            )
+        prim_cache = stage_cache.get(prim_path)
+        if prim_cache is None:
+            prim_cache = stage_cache[prim_path] = {}
+            if len(stage_cache) > XFORM_CACHE_SIZE:
+                stage_cache.popitem(last=False)
+        prim_cache[time] = xform
+
+
+def get_cached_xform(stage, prim_path: str, time):
+    """
+    Gets the cached xform of a prim and marks the prim as recently used.
+
+    Parameters:
+        stage: The stage holding the prim.
+        prim_path (str): The path of the prim.
+        time: The time of the xform.
+
+    Returns:
+        The cached xform vectors, or None if they are not cached.
+    """
+    with xform_cache_lock:
+        prim_cache = xform_cache.get(stage, {}).get(prim_path)
+        if prim_cache is None:
+            return None
+        xform_cache[stage].move_to_end(prim_path)
+        return prim_cache.get(time)
+
+
+def reset_xform_cache():
+    """
+    Clears the xform cache and revokes its stage listeners.
+    """
+    global xform_cache_stage_subscription
+
+    with xform_cache_lock:
+        for stage in list(xform_cache):
+            drop_stage_xform_cache(stage)
+        if xform_cache_stage_subscription is not None:
+            xform_cache_stage_subscription.unsubscribe()
+            xform_cache_stage_subscription = None
+
 
 class UsdHelper:
     """
@@ -32,6 +214,8 @@ class UsdHelper:
         add_and_set_test_camera: Add a test camera to the stage and set its Xform.
         get_visible_prims: Get a list of visible prims on the stage.
         get_invisible_prims: Get a list of invisible prims on the stage.
+        iter_prims_with_visibility: Traverse the stage yielding each prim with its visibility.
+        partition_prims_by_visibility: Get the visible and invisible prims on the stage in one traversal.
     """
 
     @staticmethod
@@ -81,20 +265,20 @@ class UsdHelper:
         Raises:
             RuntimeError: If the prim is invalid or does not exist.
         """
-        from pxr import UsdGeom
-
-        prim_path_escaped = html.escape(prim_path)
         stage = UsdHelper.get_stage()
         prim = stage.GetPrimAtPath(prim_path)
         try:
             xform = UsdGeom.XformCommonAPI(prim).GetXformVectors(time)
         except RuntimeError:
-            logger.error(
-                "Prim invalid/Prim does not exist for path %s", prim_path_escaped
-            )
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "Prim invalid/Prim does not exist for path %s",
+                    html.escape(prim_path),
+                )
             raise
 
-        logger.info(f"Xform of prim at path{prim_path_escaped} -> {xform}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Xform of prim at path%s -> %s", html.escape(prim_path), xform)
         return xform
 
     @staticmethod
@@ -102,7 +286,12 @@ class UsdHelper:
         """
         Gets the xform of a given prim path.
 
+        Results are cached per stage, prim path and time until the stage reports a change to the prim
+        or closes, so polling an unchanged prim does not decompose its xform again. At most
+        XFORM_CACHE_SIZE prims are cached per stage.
+
         Parameters:
+            stage: The stage holding the prim.
             prim_path (str): The path of the prim.
             time (int, optional): The time at which to get the xform. Defaults to 0.
 
@@ -112,16 +301,17 @@ class UsdHelper:
         Raises:
             RuntimeError: If the prim is invalid or does not exist.
         """
-        from pxr import UsdGeom
-
         logger.info("Get xform of given prim path")
-        prim = stage.GetPrimAtPath(prim_path)
-        try:
-            xform = UsdGeom.XformCommonAPI(prim).GetXformVectors(time)
-        except RuntimeError:
-            logger.info(f"Prim invalid/Prim does not exist: {prim_path}")
-            raise
-        logger.info(f"Xform of prim at path '{prim_path}' -> {xform}")
+        xform = get_cached_xform(stage, prim_path, time)
+        if xform is None:
+            prim = stage.GetPrimAtPath(prim_path)
+            try:
+                xform = UsdGeom.XformCommonAPI(prim).GetXformVectors(time)
+            except RuntimeError:
+                logger.info("Prim invalid/Prim does not exist: %s", prim_path)
+                raise
+            cache_xform(stage, prim_path, time, xform)
+        logger.info("Xform of prim at path '%s' -> %s", prim_path, xform)
 
         return xform
 
@@ -138,81 +328,141 @@ class UsdHelper:
         Raises:
             RuntimeError: If the prim is invalid or does not exist.
         """
-        from pxr import UsdGeom
-
         logger.info("Set given xform to prim path")
         prim = stage.GetPrimAtPath(prim_path)
-        rotation_order_dict = {
-            UsdGeom.XformCommonAPI.RotationOrderYXZ: "rotateYXZ",
-            UsdGeom.XformCommonAPI.RotationOrderXYZ: "rotateXYZ",
-            UsdGeom.XformCommonAPI.RotationOrderXZY: "rotateXZY",
-            UsdGeom.XformCommonAPI.RotationOrderYZX: "rotateYZX",
-            UsdGeom.XformCommonAPI.RotationOrderZXY: "rotateZXY",
-            UsdGeom.XformCommonAPI.RotationOrderZYX: "rotateZYX",
-        }
 
         try:
-            UsdGeom.XformCommonAPI(prim).SetTranslate(translation=xform[0])
-            UsdGeom.XformCommonAPI(prim).SetPivot(pivot=xform[3])
+            xform_api = UsdGeom.XformCommonAPI(prim)
+            xform_api.SetTranslate(translation=xform[0])
+            xform_api.SetPivot(pivot=xform[3])
 
             if "test_camera" in prim_path:
-                UsdGeom.XformCommonAPI(prim).SetRotate(
-                    rotation=xform[1], rotationOrder=xform[4]
-                )
-                UsdGeom.XformCommonAPI(prim).SetScale(scale=xform[2])
+                xform_api.SetRotate(rotation=xform[1], rotationOrder=xform[4])
+                xform_api.SetScale(scale=xform[2])
             else:
-                rotate_att = prim.GetAttribute(
-                    "xformOp:" + rotation_order_dict[xform[4]]
-                )
+                rotate_att = prim.GetAttribute(ROTATION_ORDER_ATTRIBUTES[int(xform[4])])
                 rotate_att.Set(xform[1])
-                scale_att = prim.GetAttribute("xformOp:scale")
+                scale_att = prim.GetAttribute(SCALE_ATTRIBUTE)
                 scale_att.Set(xform[2])
         except RuntimeError:
-            logger.info(f"Prim invalid/Prim does not exist: {prim_path}")
+            logger.info("Prim invalid/Prim does not exist: %s", prim_path)
             raise
 
     @staticmethod
-    def add_and_set_test_camera(stage, camera_name="test_camera", xform=None):
+    def add_and_set_test_camera(stage=None, camera_name="test_camera", xform=None):
         """
         Adds and sets a test camera in the stage.
 
         Parameters:
-            stage: The stage to add the camera to.
+            stage: The stage to add the camera to. Default is None, which uses the current stage.
             camera_name: The name of the camera. Default is 'test_camera'.
             xform: The transformation matrix for the camera. Default is None.
 
-        This function imports necessary modules, gets the active stage, and creates a new camera with the given name.
+        This function imports necessary modules and creates a new camera with the given name on the stage.
         It sets the focal length of the camera and applies the given transformation matrix.
         Finally, it sets the active viewport to the newly created camera.
         """
         import omni.kit.commands
+        import omni.kit.undo
         import omni.usd
         from omni.kit.viewport.menubar.camera.commands import SetViewportCameraCommand
         from omni.kit.viewport.utility import get_active_viewport
-        from pxr import Sdf
 
-        stage = UsdHelper.get_stage()
+        if stage is None:
+            stage = UsdHelper.get_stage()
         if not xform:
             xform = UsdHelper.getXform(stage, UsdHelper.get_default_camera_path())
 
         viewport_api = get_active_viewport()
         target_path = omni.usd.get_stage_next_free_path(stage, "/" + camera_name, True)
-        omni.kit.commands.execute(
-            "CreatePrimWithDefaultXformCommand",
-            prim_path=target_path,
-            prim_type="Camera",
-            create_default_xform=False,
-        )
+        # Group the camera creation and focal length change so they are undone together. The xform and
+        # the viewport camera are set directly and are not part of the undo group.
+        with omni.kit.undo.group():
+            omni.kit.commands.execute(
+                "CreatePrimWithDefaultXformCommand",
+                prim_path=target_path,
+                prim_type="Camera",
+                create_default_xform=False,
+            )
 
-        omni.kit.commands.execute(
-            "ChangeProperty",
-            prop_path=Sdf.Path(f"/World/{camera_name}.focalLength"),
-            value=18.14756,
-            prev=50.0,
+            omni.kit.commands.execute(
+                "ChangeProperty",
+                prop_path=Sdf.Path(f"/World/{camera_name}.focalLength"),
+                value=18.14756,
+                prev=50.0,
+            )
+
+            UsdHelper.set_xform(stage, target_path, xform)
+            SetViewportCameraCommand(target_path, viewport_api).do()
+
+    @staticmethod
+    def iter_prims_with_visibility(stage):
+        """
+        Traverses the stage and yields each prim with its computed visibility.
+
+        Inherited visibility is kept on a stack during a pre and post order walk, so each prim only
+        reads its own visibility attribute instead of resolving visibility through all of its ancestors.
+        The attribute is read only on imageable prims, like ComputeVisibility does, so prims such as
+        materials and shaders and the descendants of invisible prims cost no attribute read.
+        The walk is filtered with VISIBILITY_PRIM_PREDICATE, visiting the same prims as stage.Traverse().
+
+        Parameters:
+            stage: The stage to traverse.
+
+        Yields:
+            Tuples of the prim and a bool telling whether the prim is invisible.
+        """
+        # Bound once since they are used for every prim of the walk
+        imageable = UsdGeom.Imageable
+        invisible_token = UsdGeom.Tokens.invisible
+
+        # Whether the prim at each level of the walk is invisible, starting with the pseudo root
+        invisible_stack = [False]
+        push = invisible_stack.append
+        pop = invisible_stack.pop
+
+        iterator = iter(
+            Usd.PrimRange.PreAndPostVisit(
+                stage.GetPseudoRoot(), VISIBILITY_PRIM_PREDICATE
+            )
         )
+        is_post_visit = iterator.IsPostVisit
+        for prim in iterator:
+            if is_post_visit():
+                pop()
+                continue
+            if prim.IsPseudoRoot():
+                continue
+            invisible = invisible_stack[-1] or (
+                prim.IsA(imageable)
+                and imageable(prim).GetVisibilityAttr().Get() == invisible_token
+            )
+            push(invisible)
+            yield prim, invisible
+
+    @staticmethod
+    def partition_prims_by_visibility(stage):
+        """
+        Gets the paths of the visible and invisible prims in the stage in a single traversal.
+
+        Parameters:
+            stage: The stage to traverse.
+
+        Returns:
+            A tuple of two lists of strings, the paths of the visible prims and the paths of the invisible prims.
+        """
+        visible_assets = []
+        invisible_assets = []
+        append_visible = visible_assets.append
+        append_invisible = invisible_assets.append
+
+        for prim, invisible in UsdHelper.iter_prims_with_visibility(stage):
+            if invisible:
+                append_invisible(prim.GetPath().pathString)
+            else:
+                append_visible(prim.GetPath().pathString)
 
-        UsdHelper.set_xform(stage, target_path, xform)
-        SetViewportCameraCommand(target_path, viewport_api).do()
+        return visible_assets, invisible_assets
 
     @staticmethod
     def get_visible_prims(stage):
@@ -228,15 +478,7 @@ class UsdHelper:
         Raises:
             No exceptions are raised by this method.
         """
-        from pxr import UsdGeom
-
-        invisible_assets = []
-
-        for prim in stage.Traverse():
-            if UsdGeom.Imageable(prim).ComputeVisibility() != UsdGeom.Tokens.invisible:
-                invisible_assets.append(str(prim.GetPath()))
-
-        return invisible_assets
+        return UsdHelper.partition_prims_by_visibility(stage)[0]
 
     @staticmethod
     def get_invisible_prims(stage):
@@ -252,12 +494,4 @@ class UsdHelper:
         Raises:
             None.
         """
-        from pxr import UsdGeom
-
-        invisible_assets = []
-
-        for prim in stage.Traverse():
-            if UsdGeom.Imageable(prim).ComputeVisibility() == UsdGeom.Tokens.invisible:
-                invisible_assets.append(str(prim.GetPath()))
-
-        return invisible_assets
+        return UsdHelper.partition_prims_by_visibility(stage)[1]